@@ -3,6 +3,10 @@ Configuration centrale pour l'analyseur Minion Masters.
 Tous les paramètres de l'application sont définis ici.
 """
 
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
 # ==============================================================================
 # --- AFFICHAGE ET SUPERPOSITION GRAPHIQUE ---
 # ==============================================================================
@@ -14,12 +18,22 @@ TRANSPARENT_COLOR = 'magenta'
 # --- CAPTURE D'ÉCRAN ET PARAMÈTRES DE JEU ---
 # ==============================================================================
 
-# Configuration de la capture d'écran (plein écran 1920x1080)
+# Résolution de l'écran
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+# Zone de jeu en ratios de l'écran (x0, y0, x1, y1).
+# Seule cette région est capturée et analysée, et l'overlay est placé dessus :
+# toutes les positions exprimées en ratios ci-dessous (positions stratégiques,
+# zones d'exclusion) sont relatives à cette zone et non à l'écran entier.
+PLAYFIELD_RATIOS = (0.0, 0.0, 1.0, 1.0)
+
+# Configuration de la capture d'écran (région de la zone de jeu)
 MONITOR = {
-    "top": 0, 
-    "left": 0, 
-    "width": 1920, 
-    "height": 1080
+    "top": int(PLAYFIELD_RATIOS[1] * SCREEN_HEIGHT),
+    "left": int(PLAYFIELD_RATIOS[0] * SCREEN_WIDTH),
+    "width": int((PLAYFIELD_RATIOS[2] - PLAYFIELD_RATIOS[0]) * SCREEN_WIDTH),
+    "height": int((PLAYFIELD_RATIOS[3] - PLAYFIELD_RATIOS[1]) * SCREEN_HEIGHT)
 }
 
 # Côté du joueur - détermine la logique de classification des ennemis
@@ -106,6 +120,10 @@ MIN_POINTS_FOR_PREDICTION = 5      # Nombre minimum de points de données avant
 PLACEMENT_PREDICTION_TIME = 1.5    # Anticiper de 1.5 seconde pour placer un contre
 PLACEMENT_OFFSET_X = 50            # Décalage en pixels pour placer le minion devant l'ennemi
 
+# Filtre de Kalman à vitesse constante (état [x, y, vx, vy])
+KALMAN_PROCESS_NOISE = 5.0         # Écart-type du bruit de processus par mise à jour
+KALMAN_MEASUREMENT_NOISE = 4.0     # Écart-type du bruit de mesure des positions détectées (pixels)
+
 # ==============================================================================
 # --- PARAMÈTRES DE PERFORMANCE ---
 # ==============================================================================
@@ -113,13 +131,30 @@ PLACEMENT_OFFSET_X = 50            # Décalage en pixels pour placer le minion d
 # Délai entre les frames pour éviter de surcharger le CPU (secondes)
 FRAME_DELAY = 0.01
 
+# Niveau de journalisation des modules qui utilisent logging ("DEBUG", "INFO", "WARNING"...)
+LOG_LEVEL = "INFO"
+
+# Nombre maximum de frames identiques consécutives dont le traitement est ignoré
+STATIC_FRAME_MAX_SKIP = 30
+
 # Paramètres du détecteur de mouvement (MOG2)
 MOG2_HISTORY = 500
 MOG2_VAR_THRESHOLD = 30
 MOG2_DETECT_SHADOWS = False
+# Soustraction de fond sur la luminance seule (1 canal au lieu de 3)
+MOG2_GRAYSCALE = True
+
+# Facteur de réduction appliqué à l'image avant la soustraction de fond
+# (0.5 = analyse en 960x540, les positions sont remises à l'échelle ensuite)
+DETECTION_SCALE = 0.5
+
+# Exécution de la soustraction de fond et du lissage via OpenCL (cv2.UMat)
+# Ignoré si aucun périphérique OpenCL n'est disponible
+USE_OPENCL = False
 
-# Paramètres de lissage
-MEDIAN_BLUR_KERNEL = 7
+# Taille du noyau d'ouverture morphologique qui nettoie le masque de mouvement
+# (exprimée à la résolution de détection)
+MORPH_OPEN_KERNEL = 3
 
 # ==============================================================================
 # --- PARAMÈTRES D'AFFICHAGE ---
@@ -131,3 +166,87 @@ SUGGESTION_CIRCLE_RADIUS = 25
 # Couleur et épaisseur du cercle de suggestion
 SUGGESTION_CIRCLE_COLOR = 'lime'
 SUGGESTION_CIRCLE_WIDTH = 4
+
+# ==============================================================================
+# --- INSTANTANÉ FIGÉ DE LA CONFIGURATION ---
+# ==============================================================================
+
+@dataclass(frozen=True)
+class Config:
+    """
+    Instantané immuable de la configuration, passé aux composants à leur création.
+    Les valeurs ne changent plus une fois l'instantané pris, ce qui permet de
+    précalculer les constantes dérivées une seule fois.
+    """
+    TRANSPARENT_COLOR: str
+    SCREEN_WIDTH: int
+    SCREEN_HEIGHT: int
+    PLAYFIELD_RATIOS: Tuple[float, float, float, float]
+    MONITOR: Mapping[str, int]
+    PLAYER_SIDE: str
+    SAFE_ZONE_THRESHOLD: int
+    DEFENSIVE_POSITIONS_RATIOS: Tuple[Tuple[float, float], ...]
+    OFFENSIVE_POSITIONS_RATIOS: Tuple[Tuple[float, float], ...]
+    CENTRAL_POSITIONS_RATIOS: Tuple[Tuple[float, float], ...]
+    POSITIONS_PRINCIPALES_RATIOS: Tuple[Tuple[float, float], ...]
+    MINION_MIN_AREA: float
+    MINION_MAX_AREA: float
+    MOVEMENT_MEMORY: float
+    REID_TOLERANCE: float
+    REID_MAX_TIME: float
+    HIST_SIMILARITY_THRESHOLD: float
+    EXCLUSION_RADIUS_RATIO: float
+    EXCLUSION_CENTER_Y_RATIO: float
+    MIN_LIFETIME: float
+    MIN_DISTANCE_TRAVELED: float
+    MASS_SPAWN_THRESHOLD: int
+    STATIONARY_THRESHOLD: float
+    GAME_START_BUFFER: float
+    PREDICTION_TIME: float
+    PREDICTION_TOLERANCE: float
+    MIN_POINTS_FOR_PREDICTION: int
+    PLACEMENT_PREDICTION_TIME: float
+    PLACEMENT_OFFSET_X: float
+    KALMAN_PROCESS_NOISE: float
+    KALMAN_MEASUREMENT_NOISE: float
+    FRAME_DELAY: float
+    LOG_LEVEL: str
+    STATIC_FRAME_MAX_SKIP: int
+    MOG2_HISTORY: int
+    MOG2_VAR_THRESHOLD: float
+    MOG2_DETECT_SHADOWS: bool
+    MOG2_GRAYSCALE: bool
+    DETECTION_SCALE: float
+    USE_OPENCL: bool
+    MORPH_OPEN_KERNEL: int
+    SUGGESTION_CIRCLE_RADIUS: int
+    SUGGESTION_CIRCLE_COLOR: str
+    SUGGESTION_CIRCLE_WIDTH: int
+    
+    # Constantes dérivées (calculées à la création)
+    REID_TOLERANCE_SQ: float = field(init=False)
+    PREDICTION_TOLERANCE_SQ: float = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'REID_TOLERANCE_SQ', float(self.REID_TOLERANCE) ** 2)
+        object.__setattr__(self, 'PREDICTION_TOLERANCE_SQ', float(self.PREDICTION_TOLERANCE) ** 2)
+
+
+def snapshot() -> Config:
+    """
+    Fige les valeurs actuelles du module (surcharges en ligne de commande comprises).
+    
+    Returns:
+        Config: Instantané immuable de la configuration
+    """
+    values = {}
+    for config_field in fields(Config):
+        if not config_field.init:
+            continue
+        value = globals()[config_field.name]
+        if isinstance(value, dict):
+            value = MappingProxyType(dict(value))
+        elif isinstance(value, list):
+            value = tuple(tuple(item) for item in value)
+        values[config_field.name] = value
+    return Config(**values)
@@ -5,44 +5,332 @@ Ce module contient toute la logique OpenCV pour détecter, suivre et analyser le
 
 import cv2
 import numpy as np
+import os
 import time
+import platform
+import threading
 import mss
 from typing import Dict, List, Tuple, Optional, Set
 
-from minion import Minion
+try:
+    import dxcam
+except ImportError:
+    dxcam = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from minion import Minion, precompute_hist_bins
 import config
 
 
+# ==============================================================================
+# --- NOYAUX NUMÉRIQUES (compilés avec Numba si disponible) ---
+# ==============================================================================
+
+def _exclusion_mask_numpy(positions: np.ndarray, centers: np.ndarray,
+                          radii_sq: np.ndarray) -> np.ndarray:
+    """Version NumPy de _exclusion_mask_kernel."""
+    diff = positions[:, None, :] - centers[None, :, :]
+    d2 = (diff * diff).sum(axis=-1)
+    return (d2 <= radii_sq).any(axis=1)
+
+
+def _exclusion_mask_kernel(positions, centers, radii_sq):
+    """
+    Calcule le masque des positions situées dans au moins une zone d'exclusion.
+    
+    Args:
+        positions: Tableau (N, 2) des positions (x, y)
+        centers: Tableau (M, 2) des centres des zones
+        radii_sq: Tableau (M,) des rayons au carré
+        
+    Returns:
+        np.ndarray: Masque booléen (N,)
+    """
+    out = np.zeros(positions.shape[0], dtype=np.bool_)
+    for i in range(positions.shape[0]):
+        for j in range(centers.shape[0]):
+            dx = positions[i, 0] - centers[j, 0]
+            dy = positions[i, 1] - centers[j, 1]
+            if dx * dx + dy * dy <= radii_sq[j]:
+                out[i] = True
+                break
+    return out
+
+
+def _association_distances_numpy(minion_positions: np.ndarray, predicted_positions: np.ndarray,
+                                 has_prediction: np.ndarray, detection_positions: np.ndarray,
+                                 prediction_tolerance_sq: float) -> np.ndarray:
+    """Version NumPy de _association_distances_kernel."""
+    diff = minion_positions[:, None, :] - detection_positions[None, :, :]
+    distances_sq = (diff * diff).sum(axis=-1)
+    pred_diff = predicted_positions[:, None, :] - detection_positions[None, :, :]
+    pred_distances_sq = (pred_diff * pred_diff).sum(axis=-1)
+    bonus = has_prediction[:, None] & (pred_distances_sq < prediction_tolerance_sq)
+    distances_sq[bonus] *= 0.25
+    return distances_sq
+
+
+def _association_distances_kernel(minion_positions, predicted_positions, has_prediction,
+                                  detection_positions, prediction_tolerance_sq):
+    """
+    Calcule la matrice des distances au carré minions × détections, avec le bonus de prédiction.
+    
+    Args:
+        minion_positions: Tableau (M, 2) des dernières positions des minions
+        predicted_positions: Tableau (M, 2) des positions prédites
+        has_prediction: Masque (M,) des minions disposant d'une prédiction
+        detection_positions: Tableau (N, 2) des détections
+        prediction_tolerance_sq: Carré de la distance sous laquelle la prédiction est correcte
+        
+    Returns:
+        np.ndarray: Matrice (M, N) des distances au carré pondérées
+    """
+    m = minion_positions.shape[0]
+    n = detection_positions.shape[0]
+    out = np.empty((m, n), dtype=np.float32)
+    for i in range(m):
+        for j in range(n):
+            dx = minion_positions[i, 0] - detection_positions[j, 0]
+            dy = minion_positions[i, 1] - detection_positions[j, 1]
+            distance_sq = dx * dx + dy * dy
+            if has_prediction[i]:
+                pdx = predicted_positions[i, 0] - detection_positions[j, 0]
+                pdy = predicted_positions[i, 1] - detection_positions[j, 1]
+                if pdx * pdx + pdy * pdy < prediction_tolerance_sq:
+                    distance_sq *= 0.25  # Bonus (distance divisée par 2) pour les prédictions correctes
+            out[i, j] = distance_sq
+    return out
+
+
+if njit is not None:
+    exclusion_mask = njit(cache=True, fastmath=True)(_exclusion_mask_kernel)
+    association_distances = njit(cache=True, fastmath=True)(_association_distances_kernel)
+else:
+    exclusion_mask = _exclusion_mask_numpy
+    association_distances = _association_distances_numpy
+
+
+class MSSCapture:
+    """
+    Backend de capture portable basé sur MSS.
+    Utilisé par défaut hors Windows ou si DXcam n'est pas disponible.
+    """
+    
+    def __init__(self, monitor: Dict[str, int]):
+        """
+        Args:
+            monitor: Région de capture (top, left, width, height)
+        """
+        self.monitor = monitor
+        self.sct = mss.mss()
+    
+    def grab(self, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Capture la région configurée.
+        
+        Args:
+            dst: Buffer BGR préalloué dans lequel écrire l'image (optionnel)
+            
+        Returns:
+            np.ndarray: Image capturée au format BGR
+        """
+        sct_img = self.sct.grab(self.monitor)
+        bgra = np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(sct_img.height, sct_img.width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=dst)
+    
+    def close(self):
+        """Libère les ressources MSS."""
+        self.sct.close()
+
+
+class WindowsDXGICapture:
+    """
+    Backend de capture Windows basé sur DXGI Desktop Duplication (DXcam).
+    Les frames arrivent directement en BGR, sans conversion ni copie supplémentaire.
+    """
+    
+    def __init__(self, monitor: Dict[str, int], target_fps: int = 60):
+        """
+        Args:
+            monitor: Région de capture (top, left, width, height)
+            target_fps: Cadence de capture visée
+        """
+        region = (
+            monitor["left"],
+            monitor["top"],
+            monitor["left"] + monitor["width"],
+            monitor["top"] + monitor["height"]
+        )
+        self.camera = dxcam.create(output_color="BGR")
+        self.camera.start(region=region, target_fps=target_fps, video_mode=True)
+    
+    def grab(self, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Récupère la dernière frame produite par la duplication DXGI.
+        DXcam fournit son propre tableau : dst est ignoré pour éviter une copie.
+        
+        Args:
+            dst: Non utilisé (compatibilité avec MSSCapture)
+            
+        Returns:
+            np.ndarray: Image capturée au format BGR
+        """
+        return self.camera.get_latest_frame()
+    
+    def close(self):
+        """Arrête la capture DXGI."""
+        self.camera.stop()
+
+
+def create_screen_capture(monitor: Dict[str, int]):
+    """
+    Sélectionne le backend de capture le plus rapide disponible.
+    
+    Args:
+        monitor: Région de capture (top, left, width, height)
+        
+    Returns:
+        WindowsDXGICapture sous Windows si DXcam est installé, sinon MSSCapture
+    """
+    if platform.system() == "Windows" and dxcam is not None:
+        return WindowsDXGICapture(monitor)
+    return MSSCapture(monitor)
+
+
 class MinionDetector:
     """
     Détecteur principal pour les minions dans Minion Masters.
     Utilise OpenCV pour la détection de mouvement et le suivi d'objets.
     """
     
-    def __init__(self):
-        """Initialise le détecteur avec tous les paramètres nécessaires."""
+    def __init__(self, cfg: Optional[config.Config] = None):
+        """
+        Initialise le détecteur avec tous les paramètres nécessaires.
+        
+        Args:
+            cfg: Instantané de configuration (par défaut config.snapshot())
+        """
         # Configuration de base
-        self.frame_width = config.MONITOR["width"]
-        self.frame_height = config.MONITOR["height"]
+        self.cfg = cfg if cfg is not None else config.snapshot()
+        self.frame_width = self.cfg.MONITOR["width"]
+        self.frame_height = self.cfg.MONITOR["height"]
+        
+        # Optimisations OpenCV : code SIMD, multi-threading et OpenCL (T-API) si demandé
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(os.cpu_count() or 1)
+        self.use_opencl = self.cfg.USE_OPENCL and cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        
+        # Système de détection de mouvement (sur image réduite)
+        self.detection_scale = self.cfg.DETECTION_SCALE
+        self._open_kernel = cv2.getStructuringElement(
+            cv2.MORPH_ELLIPSE, (self.cfg.MORPH_OPEN_KERNEL, self.cfg.MORPH_OPEN_KERNEL)
+        )
+        # Le modèle MOG2 dépend du nombre de canaux : le mode est fixé une fois pour toutes ici
+        self.grayscale_detection = self.cfg.MOG2_GRAYSCALE
+        self.detection_size = (
+            int(round(self.frame_width * self.detection_scale)),
+            int(round(self.frame_height * self.detection_scale))
+        )
         
-        # Système de détection de mouvement
+        # Buffers réutilisés d'une frame à l'autre (évite ~8 Mo d'allocations par frame)
+        detection_shape = (self.detection_size[1], self.detection_size[0])
+        channels = () if self.grayscale_detection else (3,)
+        self._gray_buf = np.empty((self.frame_height, self.frame_width), dtype=np.uint8)
+        # Deux buffers alternés : la frame réduite précédente sert à détecter les frames inchangées
+        self._small_bufs = [np.empty(detection_shape + channels, dtype=np.uint8) for _ in range(2)]
+        self._small_idx = 0
+        self._fg_buf = np.empty(detection_shape, dtype=np.uint8)
+        self._mask_buf = np.empty(detection_shape, dtype=np.uint8)
+        self._full_mask_buf = np.empty((self.frame_height, self.frame_width), dtype=np.uint8)
+        # Frame convertie en HSV puis en indices de case d'histogramme, une seule fois par frame
+        self._hsv_buf = np.empty((self.frame_height, self.frame_width, 3), dtype=np.uint8)
+        self._hist_bins_buf = np.empty((self.frame_height, self.frame_width), dtype=np.uint16)
         self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
-            history=config.MOG2_HISTORY,
-            varThreshold=config.MOG2_VAR_THRESHOLD,
-            detectShadows=config.MOG2_DETECT_SHADOWS
+            history=self.cfg.MOG2_HISTORY,
+            varThreshold=self.cfg.MOG2_VAR_THRESHOLD,
+            detectShadows=self.cfg.MOG2_DETECT_SHADOWS
         )
         
         # Suivi des minions
         self.minions: Dict[int, Minion] = {}
         self.next_minion_id = 1
         
+        # État courant des minions suivis, en tableaux parallèles (une ligne par minion,
+        # même ordre que self.minions). Les objets Minion gardent l'historique complet.
+        self._tracked: List[Minion] = []
+        self._last_xy = np.zeros((64, 2), dtype=np.float32)
+        self._last_seen = np.zeros(64, dtype=np.float64)
+        self._creation_time = np.zeros(64, dtype=np.float64)
+        self._active_mask = np.zeros(64, dtype=bool)
+        self._valid_mask = np.zeros(64, dtype=bool)
+        self._enemy_mask = np.zeros(64, dtype=bool)
+        
+        # Dernières positions (N, 2) des minions renvoyés par get_enemy_minions,
+        # dans le même ordre : l'analyse stratégique les lit sans parcourir les minions
+        self.enemy_last_positions = np.empty((0, 2), dtype=np.float32)
+        
         # Zones d'exclusion (tours de maître, etc.)
         self.exclusion_zones = self._calculate_exclusion_zones()
+        self._excl_centers = np.array([(cx, cy) for cx, cy, _ in self.exclusion_zones], dtype=np.float32)
+        self._excl_r2 = np.array([r * r for _, _, r in self.exclusion_zones], dtype=np.float32)
+        
+        # Seuils de distance au carré (évite les racines carrées dans les comparaisons)
+        self._reid_tol2 = self.cfg.REID_TOLERANCE_SQ
+        self._pred_tol2 = self.cfg.PREDICTION_TOLERANCE_SQ
+        
+        # Paramètres lus à chaque frame, figés ici pour éviter les accès au module config
+        area_scale = self.detection_scale * self.detection_scale
+        self._min_area = self.cfg.MINION_MIN_AREA * area_scale
+        self._max_area = self.cfg.MINION_MAX_AREA * area_scale
+        # Masque contenant moins de pixels que l'aire minimale : aucune détection possible
+        self._mask_is_empty = False
+        self._inv_scale = 1.0 / self.detection_scale
+        self._hist_threshold = self.cfg.HIST_SIMILARITY_THRESHOLD
+        self._mass_spawn_threshold = self.cfg.MASS_SPAWN_THRESHOLD
+        self._movement_memory = self.cfg.MOVEMENT_MEMORY
+        self._min_lifetime = self.cfg.MIN_LIFETIME
+        self._reid_max_time = self.cfg.REID_MAX_TIME
+        self._static_frame_max_skip = self.cfg.STATIC_FRAME_MAX_SKIP
+        self._frame_delay = self.cfg.FRAME_DELAY
+        
+        # Compilation anticipée des noyaux Numba (évite la latence sur la première frame)
+        self._warm_up_kernels()
+        
+        # Capture d'écran dans un thread dédié (seule la dernière frame est conservée).
+        # Triple buffering : une frame en cours d'écriture, la plus récente, et celle en
+        # cours de traitement par process_frame.
+        self.screen_capture = None
+        self._frame_buffers = [
+            np.empty((self.frame_height, self.frame_width, 3), dtype=np.uint8) for _ in range(3)
+        ]
+        self._frames: List[Optional[np.ndarray]] = [None] * 3
+        self._latest_idx = -1
+        self._reading_idx = -1
+        self._frame_lock = threading.Lock()
+        self._frame_event = threading.Event()
+        self._capture_ready = threading.Event()
+        self._stop_capture = threading.Event()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            daemon=True,
+            name="CaptureThread"
+        )
+        self._capture_thread.start()
+        self._capture_ready.wait(timeout=5.0)
         
-        # Capture d'écran
-        self.screen_capture = mss.mss()
+        # Détection des frames inchangées
+        self._last_small_frame = None
+        self._static_frames = 0
+        self._last_results: Optional[Tuple[List[Minion], List[Minion]]] = None
         
         print(f"✅ Détecteur initialisé pour {self.frame_width}x{self.frame_height}")
+        print(f"   Capture: {type(self.screen_capture).__name__}")
+        print(f"   OpenCL: {'ACTIVÉ' if self.use_opencl else 'DÉSACTIVÉ'}")
         print(f"   Zones d'exclusion: {len(self.exclusion_zones)} zones configurées")
     
     def _calculate_exclusion_zones(self) -> List[Tuple[float, float, float]]:
@@ -52,8 +340,8 @@ class MinionDetector:
         Returns:
             List[Tuple[float, float, float]]: Liste de (center_x, center_y, radius) pour chaque zone
         """
-        exclusion_radius = self.frame_width * config.EXCLUSION_RADIUS_RATIO
-        center_y = self.frame_height * config.EXCLUSION_CENTER_Y_RATIO
+        exclusion_radius = self.frame_width * self.cfg.EXCLUSION_RADIUS_RATIO
+        center_y = self.frame_height * self.cfg.EXCLUSION_CENTER_Y_RATIO
         
         zones = [
             (exclusion_radius, center_y, exclusion_radius),                    # Zone gauche
@@ -62,211 +350,394 @@ class MinionDetector:
         
         return zones
     
+    def _warm_up_kernels(self):
+        """Appelle une fois chaque noyau numérique sur des données factices."""
+        dummy = np.zeros((1, 2), dtype=np.float32)
+        exclusion_mask(dummy, self._excl_centers, self._excl_r2)
+        association_distances(dummy, dummy, np.zeros(1, dtype=bool), dummy, self._pred_tol2)
+    
+    def _capture_loop(self):
+        """
+        Boucle du thread de capture : capture en continu et remplace la dernière frame.
+        Le backend est créé dans ce thread (les contextes MSS sont liés à leur thread).
+        """
+        try:
+            self.screen_capture = create_screen_capture(self.cfg.MONITOR)
+        finally:
+            self._capture_ready.set()
+        
+        try:
+            while not self._stop_capture.is_set():
+                # Buffer libre : ni la frame la plus récente, ni celle en cours de traitement
+                with self._frame_lock:
+                    write_idx = next(idx for idx in range(3)
+                                     if idx != self._latest_idx and idx != self._reading_idx)
+                
+                frame = self.screen_capture.grab(dst=self._frame_buffers[write_idx])
+                if frame is not None:
+                    with self._frame_lock:
+                        self._frames[write_idx] = frame
+                        self._latest_idx = write_idx
+                        self._frame_event.set()
+                time.sleep(self._frame_delay)
+        finally:
+            self.screen_capture.close()
+    
     def capture_screen(self) -> np.ndarray:
         """
-        Capture l'écran selon la configuration définie.
+        Récupère la frame la plus récente produite par le thread de capture.
+        Bloque jusqu'à ce qu'une nouvelle frame soit disponible. La frame reste
+        valide jusqu'à l'appel suivant.
         
         Returns:
             np.ndarray: Image capturée au format BGR
         """
-        sct_img = self.screen_capture.grab(config.MONITOR)
-        frame = cv2.cvtColor(np.array(sct_img), cv2.COLOR_BGRA2BGR)
+        while not self._frame_event.wait(timeout=1.0):
+            if not self._capture_thread.is_alive():
+                raise RuntimeError("Le thread de capture s'est arrêté")
+        
+        with self._frame_lock:
+            self._reading_idx = self._latest_idx
+            frame = self._frames[self._reading_idx]
+            self._frame_event.clear()
         return frame
     
-    def detect_movement(self, frame: np.ndarray) -> np.ndarray:
+    def prepare_frame(self, frame: np.ndarray):
+        """
+        Prépare l'image pour la détection de mouvement : réduction (voir DETECTION_SCALE)
+        et passage en niveaux de gris si MOG2_GRAYSCALE est activé.
+        
+        Args:
+            frame: Image capturée au format BGR
+            
+        Returns:
+            Image réduite (np.ndarray, ou cv2.UMat si OpenCL est actif)
+        """
+        if self.use_opencl:
+            # Toute la chaîne s'exécute sur le périphérique OpenCL
+            frame = cv2.UMat(frame)
+            if self.grayscale_detection:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if self.detection_scale != 1.0:
+                frame = cv2.resize(frame, self.detection_size, interpolation=cv2.INTER_AREA)
+            return frame
+        
+        small = self._small_bufs[self._small_idx]
+        self._small_idx ^= 1
+        
+        if self.grayscale_detection and self.detection_scale != 1.0:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+            cv2.resize(self._gray_buf, self.detection_size, dst=small, interpolation=cv2.INTER_AREA)
+        elif self.grayscale_detection:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=small)
+        elif self.detection_scale != 1.0:
+            cv2.resize(frame, self.detection_size, dst=small, interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(small, frame)
+        
+        return small
+    
+    def detect_movement(self, frame) -> np.ndarray:
         """
         Détecte les zones de mouvement dans l'image.
         
         Args:
-            frame: Image à analyser
+            frame: Image réduite retournée par prepare_frame
             
         Returns:
-            np.ndarray: Masque binaire des zones en mouvement
+            np.ndarray: Masque binaire des zones en mouvement (résolution réduite)
         """
+        if self.use_opencl:
+            mask = self.background_subtractor.apply(frame)
+            self._mask_is_empty = cv2.countNonZero(mask) <= self._min_area
+            if self._mask_is_empty:
+                return mask.get()
+            return cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._open_kernel).get()
+        
         # Application du détecteur de fond
-        mask = self.background_subtractor.apply(frame)
+        self.background_subtractor.apply(frame, fgmask=self._fg_buf)
+        
+        # Scène au repos (début de partie, temps morts) : l'ouverture ne fait que
+        # retirer des pixels, aucune composante ne pourra atteindre l'aire minimale
+        self._mask_is_empty = cv2.countNonZero(self._fg_buf) <= self._min_area
+        if self._mask_is_empty:
+            return self._fg_buf
         
-        # Lissage pour réduire le bruit
-        mask = cv2.medianBlur(mask, config.MEDIAN_BLUR_KERNEL)
+        # Ouverture morphologique pour supprimer le bruit (masque binaire)
+        cv2.morphologyEx(self._fg_buf, cv2.MORPH_OPEN, self._open_kernel, dst=self._mask_buf)
         
-        return mask
+        return self._mask_buf
     
     def find_contours(self, mask: np.ndarray) -> List[Tuple[float, float]]:
         """
-        Trouve les contours dans le masque et extrait les positions des minions potentiels.
+        Extrait les composantes connexes du masque et les positions des minions potentiels.
+        L'aire et le centroïde de chaque composante sont obtenus en une seule passe.
         
         Args:
-            mask: Masque binaire des zones en mouvement
+            mask: Masque binaire des zones en mouvement (résolution réduite)
             
         Returns:
-            List[Tuple[float, float]]: Liste des positions (x, y) des détections valides
+            List[Tuple[float, float]]: Liste des positions (x, y) des détections valides,
+            en coordonnées pleine résolution
         """
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        count, _, stats, centroids = cv2.connectedComponentsWithStats(mask, connectivity=8)
         
-        detected_positions = []
+        # Filtrage par taille (l'étiquette 0 correspond au fond)
+        areas = stats[1:count, cv2.CC_STAT_AREA]
+        keep = (areas > self._min_area) & (areas < self._max_area)
+        if not keep.any():
+            return []
         
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            
-            # Filtrage par taille
-            if config.MINION_MIN_AREA < area < config.MINION_MAX_AREA:
-                (x, y), _ = cv2.minEnclosingCircle(contour)
-                
-                # Vérification des zones d'exclusion
-                if not self._is_in_exclusion_zone(x, y):
-                    detected_positions.append((x, y))
+        # Les centroïdes sont mesurés sur le masque réduit
+        positions = (centroids[1:count][keep] * self._inv_scale).astype(np.float32)
+        
+        # Vérification des zones d'exclusion sur toutes les détections à la fois
+        positions = positions[~self._is_in_exclusion_zone(positions)]
         
-        return detected_positions
+        return [(float(x), float(y)) for x, y in positions]
     
-    def _is_in_exclusion_zone(self, x: float, y: float) -> bool:
+    def _is_in_exclusion_zone(self, positions: np.ndarray) -> np.ndarray:
         """
-        Vérifie si une position se trouve dans une zone d'exclusion.
+        Vérifie quelles positions se trouvent dans une zone d'exclusion.
         
         Args:
-            x, y: Coordonnées à vérifier
+            positions: Tableau (N, 2) des coordonnées (x, y) à vérifier
             
         Returns:
-            bool: True si la position est dans une zone d'exclusion
+            np.ndarray: Masque booléen (N,), True si la position est dans une zone d'exclusion
         """
-        for center_x, center_y, radius in self.exclusion_zones:
-            distance = np.hypot(x - center_x, y - center_y)
-            if distance <= radius:
-                return True
-        return False
+        return exclusion_mask(positions, self._excl_centers, self._excl_r2)
     
     def update_minion_tracking(self, detected_positions: List[Tuple[float, float]], 
-                             frame: np.ndarray, mask: np.ndarray, current_time: float):
+                             bin_frame: np.ndarray, mask: np.ndarray, current_time: float):
         """
         Met à jour le suivi des minions avec les nouvelles détections.
         
         Args:
             detected_positions: Positions détectées dans cette frame
-            frame: Image actuelle
+            bin_frame: Indices de case d'histogramme de la frame (voir precompute_hist_bins)
             mask: Masque de mouvement
             current_time: Timestamp actuel
         """
         used_detections: Set[int] = set()
         
+        # Histogrammes des détections, calculés au plus une fois par frame
+        detection_hists: List[Optional[np.ndarray]] = [None] * len(detected_positions)
+        
         # 1. Association des détections aux minions existants
         self._associate_detections_to_existing_minions(
-            detected_positions, used_detections, frame, mask, current_time
+            detected_positions, used_detections, bin_frame, mask, current_time, detection_hists
         )
         
         # 2. Création de nouveaux minions pour les détections non associées
         self._create_new_minions(
-            detected_positions, used_detections, frame, mask, current_time
+            detected_positions, used_detections, bin_frame, mask, current_time, detection_hists
         )
         
         # 3. Mise à jour du statut des minions
         self._update_minion_status(current_time)
     
+    @staticmethod
+    def _detection_hist(detection_hists: List[Optional[np.ndarray]], index: int,
+                        detected_positions: List[Tuple[float, float]],
+                        bin_frame: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Retourne l'histogramme d'une détection, calculé à la première demande.
+        
+        Args:
+            detection_hists: Cache des histogrammes de la frame (une entrée par détection)
+            index: Indice de la détection
+            detected_positions: Positions détectées dans cette frame
+            bin_frame: Indices de case d'histogramme de la frame (voir precompute_hist_bins)
+            mask: Masque de mouvement
+            
+        Returns:
+            np.ndarray: Histogramme HSV centré et de norme unitaire de la détection
+        """
+        hist = detection_hists[index]
+        if hist is None:
+            hist = Minion.compute_hist(bin_frame, mask, detected_positions[index])
+            detection_hists[index] = hist
+        return hist
+    
     def _associate_detections_to_existing_minions(self, detected_positions: List[Tuple[float, float]],
-                                                used_detections: Set[int], frame: np.ndarray,
-                                                mask: np.ndarray, current_time: float):
+                                                used_detections: Set[int], bin_frame: np.ndarray,
+                                                mask: np.ndarray, current_time: float,
+                                                detection_hists: List[Optional[np.ndarray]]):
         """
         Associe les nouvelles détections aux minions existants.
+        Les distances minions × détections sont calculées en une seule matrice ;
+        l'histogramme n'est comparé que pour le meilleur candidat de chaque minion.
         """
-        for minion in self.minions.values():
-            if not minion.active:
+        active_rows = np.flatnonzero(self._active_mask[:len(self._tracked)])
+        if len(active_rows) == 0 or not detected_positions:
+            return
+        
+        active_minions = [self._tracked[row] for row in active_rows]
+        minion_positions = self._last_xy[active_rows]
+        detection_positions = np.array(detected_positions, dtype=np.float32)
+        
+        # Positions prédites (bonus pour les détections proches de la prédiction)
+        predicted = [minion.get_predicted_position_at_time(current_time) for minion in active_minions]
+        has_prediction = np.array([bool(pred) for pred in predicted], dtype=bool)
+        predicted_positions = np.array([pred if pred else (0.0, 0.0) for pred in predicted],
+                                       dtype=np.float32)
+        
+        # Matrice des distances au carré pondérées (M minions × N détections)
+        distances_sq = association_distances(
+            minion_positions, predicted_positions, has_prediction,
+            detection_positions, self._pred_tol2
+        )
+        
+        # Les détections déjà utilisées sont exclues
+        available = np.ones(len(detected_positions), dtype=bool)
+        available[list(used_detections)] = False
+        
+        # Associations retenues, appliquées ensemble après l'appariement
+        matched_rows, matched_minions, matched_detections = [], [], []
+        
+        for row, minion in enumerate(active_minions):
+            candidate_distances = np.where(available, distances_sq[row], np.inf)
+            best_match_idx = int(np.argmin(candidate_distances))
+            
+            if candidate_distances[best_match_idx] >= self._reid_tol2:
                 continue
-                
-            best_match_idx = -1
-            min_distance = config.REID_TOLERANCE
-            best_similarity = 0
             
-            # Recherche de la meilleure correspondance
-            for i, (x, y) in enumerate(detected_positions):
-                if i in used_detections:
-                    continue
-                
-                # Distance euclidienne
-                distance = np.hypot(minion.positions[-1][0] - x, minion.positions[-1][1] - y)
-                
-                # Vérification de la prédiction si disponible
-                predicted_pos = minion.get_predicted_position_at_time(current_time)
-                if predicted_pos:
-                    pred_distance = np.hypot(predicted_pos[0] - x, predicted_pos[1] - y)
-                    if pred_distance < config.PREDICTION_TOLERANCE:
-                        distance *= 0.5  # Bonus pour les prédictions correctes
-                
-                # Similarité d'histogramme
-                similarity = minion.similarity(frame, mask, (x, y))
-                
-                # Critères de sélection combinés
-                if (distance < min_distance and 
-                    similarity > config.HIST_SIMILARITY_THRESHOLD and
-                    similarity > best_similarity):
-                    min_distance = distance
-                    best_match_idx = i
-                    best_similarity = similarity
+            # Similarité d'histogramme sur le meilleur candidat uniquement
+            hist = self._detection_hist(detection_hists, best_match_idx, detected_positions, bin_frame, mask)
+            similarity = minion.compare_hist(hist)
+            if similarity <= self._hist_threshold:
+                continue
             
-            # Mise à jour du minion si une correspondance est trouvée
-            if best_match_idx != -1:
-                x, y = detected_positions[best_match_idx]
-                minion.update_position((x, y), frame, mask, current_time)
-                used_detections.add(best_match_idx)
+            matched_rows.append(active_rows[row])
+            matched_minions.append(minion)
+            matched_detections.append(best_match_idx)
+            used_detections.add(best_match_idx)
+            available[best_match_idx] = False
+        
+        if not matched_minions:
+            return
+        
+        # Mise à jour groupée des minions associés
+        Minion.batch_update(matched_minions, detection_positions[matched_detections],
+                            bin_frame, mask, current_time,
+                            hists=[detection_hists[index] for index in matched_detections])
+        for row, minion in zip(matched_rows, matched_minions):
+            minion.validate_as_minion(current_time)
+            self._sync_row(row, minion)
     
     def _create_new_minions(self, detected_positions: List[Tuple[float, float]],
-                          used_detections: Set[int], frame: np.ndarray,
-                          mask: np.ndarray, current_time: float):
+                          used_detections: Set[int], bin_frame: np.ndarray,
+                          mask: np.ndarray, current_time: float,
+                          detection_hists: List[Optional[np.ndarray]]):
         """
         Crée de nouveaux minions pour les détections non associées.
         """
+        # Vérification anti-spam : trop de détections simultanées signalent
+        # un sort de zone plutôt que de vrais minions
+        if len(detected_positions) > self._mass_spawn_threshold:
+            return
+        
         for i, (x, y) in enumerate(detected_positions):
             if i not in used_detections:
-                # Vérification anti-spam (détection de sorts de masse)
-                if self._is_mass_spawn_event(detected_positions, current_time):
-                    continue
-                
                 # Création du nouveau minion
                 new_minion = Minion(
                     id=self.next_minion_id,
                     position=(x, y),
-                    frame=frame,
+                    bin_frame=bin_frame,
                     mask=mask,
                     frame_width=self.frame_width,
                     frame_height=self.frame_height,
-                    timestamp=current_time
+                    timestamp=current_time,
+                    hist=self._detection_hist(detection_hists, i, detected_positions, bin_frame, mask)
                 )
                 
                 self.minions[self.next_minion_id] = new_minion
+                self._add_tracked(new_minion)
                 self.next_minion_id += 1
     
-    def _is_mass_spawn_event(self, detected_positions: List[Tuple[float, float]], 
-                           current_time: float) -> bool:
+    # Tableaux parallèles indexés par ligne de minion suivi
+    _ROW_ARRAYS = ('_last_xy', '_last_seen', '_creation_time',
+                   '_active_mask', '_valid_mask', '_enemy_mask')
+    
+    def _add_tracked(self, minion: Minion):
         """
-        Détecte si nous avons un événement de spawn massif (sort de zone).
+        Ajoute un minion aux tableaux de suivi.
         
         Args:
-            detected_positions: Positions détectées
-            current_time: Timestamp actuel
-            
-        Returns:
-            bool: True s'il s'agit probablement d'un événement de spawn massif
+            minion: Minion nouvellement créé
+        """
+        row = len(self._tracked)
+        if row == len(self._last_xy):
+            # Doublement de la capacité
+            for name in self._ROW_ARRAYS:
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        
+        self._creation_time[row] = minion.creation_time
+        self._tracked.append(minion)
+        self._sync_row(row, minion)
+    
+    def _sync_row(self, row: int, minion: Minion):
+        """
+        Recopie l'état courant d'un minion dans sa ligne des tableaux de suivi.
+        
+        Args:
+            row: Ligne du minion
+            minion: Minion correspondant
+        """
+        self._last_xy[row] = minion.last_position
+        self._last_seen[row] = minion.last_seen
+        self._active_mask[row] = minion.active
+        self._valid_mask[row] = minion.is_valid_minion
+        self._enemy_mask[row] = minion.is_likely_enemy()
+    
+    def _compact_tracked(self, keep: np.ndarray):
         """
-        return len(detected_positions) > config.MASS_SPAWN_THRESHOLD
+        Compacte les tableaux de suivi après suppression de minions.
+        
+        Args:
+            keep: Masque booléen des lignes à conserver
+        """
+        count = int(keep.sum())
+        for name in self._ROW_ARRAYS:
+            array = getattr(self, name)
+            array[:count] = array[:len(keep)][keep]
+        self._tracked = [minion for minion, kept in zip(self._tracked, keep) if kept]
     
     def _update_minion_status(self, current_time: float):
         """
         Met à jour le statut de tous les minions et nettoie les anciens.
         """
-        minions_to_remove = []
-        
-        for minion_id, minion in self.minions.items():
-            # Marquer comme inactif si pas vu récemment
-            if current_time - minion.last_seen > config.MOVEMENT_MEMORY:
-                minion.active = False
-            
-            # Validation du minion
+        count = len(self._tracked)
+        if count == 0:
+            return
+        
+        active = self._active_mask[:count]
+        valid = self._valid_mask[:count]
+        age = current_time - self._last_seen[:count]
+        
+        # Marquer comme inactifs les minions pas vus récemment
+        stale = active & (age > self._movement_memory)
+        for row in np.flatnonzero(stale):
+            self._tracked[row].active = False
+        active &= ~stale
+        
+        # Validation : les minions mis à jour sont validés lors de l'association ;
+        # sans mise à jour seule la durée de vie évolue, donc seuls les minions
+        # pas encore validés et assez anciens peuvent changer de statut
+        pending = ~valid & (current_time - self._creation_time[:count] > self._min_lifetime)
+        for row in np.flatnonzero(pending):
+            minion = self._tracked[row]
             minion.validate_as_minion(current_time)
-            
-            # Suppression des très anciens minions
-            if current_time - minion.last_seen > config.REID_MAX_TIME:
-                minions_to_remove.append(minion_id)
-        
-        # Nettoyage
-        for minion_id in minions_to_remove:
-            del self.minions[minion_id]
+            self._sync_row(row, minion)
+        
+        # Suppression des très anciens minions
+        expired = age > self._reid_max_time
+        if expired.any():
+            for row in np.flatnonzero(expired):
+                del self.minions[self._tracked[row].id]
+            self._compact_tracked(~expired)
     
     def get_active_minions(self) -> List[Minion]:
         """
@@ -275,24 +746,23 @@ class MinionDetector:
         Returns:
             List[Minion]: Liste des minions actifs
         """
-        return [minion for minion in self.minions.values() 
-                if minion.is_valid_minion and minion.active]
+        count = len(self._tracked)
+        rows = np.flatnonzero(self._valid_mask[:count] & self._active_mask[:count])
+        return [self._tracked[row] for row in rows]
     
     def get_enemy_minions(self) -> List[Minion]:
         """
         Retourne la liste des minions ennemis identifiés.
+        Met aussi à jour enemy_last_positions (positions de ces minions).
         
         Returns:
             List[Minion]: Liste des minions ennemis
         """
-        enemy_minions = []
-        
-        for minion in self.get_active_minions():
-            strategy_info = minion.get_strategy_info()
-            if strategy_info and strategy_info.get('likely_enemy', False):
-                enemy_minions.append(minion)
-        
-        return enemy_minions
+        count = len(self._tracked)
+        rows = np.flatnonzero(self._valid_mask[:count] & self._active_mask[:count]
+                              & self._enemy_mask[:count])
+        self.enemy_last_positions = self._last_xy[rows]
+        return [self._tracked[row] for row in rows]
     
     def process_frame(self) -> Tuple[List[Minion], List[Minion]]:
         """
@@ -307,19 +777,60 @@ class MinionDetector:
         frame = self.capture_screen()
         
         # 2. Détection de mouvement
-        mask = self.detect_movement(frame)
+        small_frame = self.prepare_frame(frame)
         
-        # 3. Extraction des contours
-        detected_positions = self.find_contours(mask)
+        # Frame identique à la précédente (menu, pause...) : résultats réutilisés
+        if self._is_static_frame(small_frame):
+            return self._last_results
+        
+        mask = self.detect_movement(small_frame)
+        
+        # 3. Extraction des contours (inutile si le masque est quasiment vide)
+        detected_positions = [] if self._mask_is_empty else self.find_contours(mask)
+        
+        bin_frame = None
+        if detected_positions:
+            # Le masque est ramené à la résolution de la frame pour les histogrammes
+            if mask.shape[:2] != frame.shape[:2]:
+                mask = cv2.resize(mask, (frame.shape[1], frame.shape[0]),
+                                  dst=self._full_mask_buf, interpolation=cv2.INTER_NEAREST)
+            # Quantification HSV unique (zone des détections), partagée par tous les histogrammes
+            bin_frame = precompute_hist_bins(frame, detected_positions, self._hsv_buf,
+                                             self._hist_bins_buf)
         
         # 4. Mise à jour du suivi
-        self.update_minion_tracking(detected_positions, frame, mask, current_time)
+        self.update_minion_tracking(detected_positions, bin_frame, mask, current_time)
         
         # 5. Retour des résultats
         active_minions = self.get_active_minions()
         enemy_minions = self.get_enemy_minions()
         
-        return active_minions, enemy_minions
+        self._last_results = (active_minions, enemy_minions)
+        return self._last_results
+    
+    def _is_static_frame(self, small_frame) -> bool:
+        """
+        Compare l'image réduite avec celle de la frame précédente.
+        Au-delà de STATIC_FRAME_MAX_SKIP frames identiques consécutives, la frame est
+        traitée normalement pour ne pas figer le modèle MOG2.
+        
+        Args:
+            small_frame: Image réduite retournée par prepare_frame
+            
+        Returns:
+            bool: True si la frame peut être ignorée
+        """
+        previous = self._last_small_frame
+        self._last_small_frame = small_frame
+        
+        if (previous is not None and self._last_results is not None
+                and self._static_frames < self._static_frame_max_skip
+                and cv2.norm(small_frame, previous, cv2.NORM_INF) == 0):
+            self._static_frames += 1
+            return True
+        
+        self._static_frames = 0
+        return False
     
     def get_detection_stats(self) -> Dict[str, any]:
         """
@@ -342,19 +853,23 @@ class MinionDetector:
     
     def cleanup(self):
         """Nettoie les ressources utilisées par le détecteur."""
-        if hasattr(self, 'screen_capture'):
-            self.screen_capture.close()
+        self._stop_capture.set()
+        if self._capture_thread.is_alive():
+            self._capture_thread.join(timeout=2.0)
         print("🧹 Détecteur nettoyé.")
 
 
-def create_detector() -> MinionDetector:
+def create_detector(cfg: Optional[config.Config] = None) -> MinionDetector:
     """
     Factory function pour créer un détecteur configuré.
     
+    Args:
+        cfg: Instantané de configuration (par défaut config.snapshot())
+        
     Returns:
         MinionDetector: Instance configurée du détecteur
     """
-    return MinionDetector()
+    return MinionDetector(cfg)
 
 
 # ==============================================================================
@@ -379,7 +894,7 @@ def analyze_detection_quality(minions: List[Minion]) -> Dict[str, float]:
             'enemy_ratio': 0
         }
     
-    total_lifetime = sum(m.timestamps[-1] - m.creation_time for m in minions)
+    total_lifetime = sum(m.last_seen - m.creation_time for m in minions)
     total_distance = sum(m.total_distance_traveled for m in minions)
     valid_count = sum(1 for m in minions if m.is_valid_minion)
     enemy_count = sum(1 for m in minions if m.get_strategy_info() and 
@@ -410,10 +925,7 @@ def filter_minions_by_position(minions: List[Minion],
     filtered = []
     
     for minion in minions:
-        if not minion.positions:
-            continue
-            
-        x, y = minion.positions[-1]
+        x, y = minion.last_position
         
         if x_range and not (x_range[0] <= x <= x_range[1]):
             continue
@@ -447,14 +959,11 @@ def get_minions_in_danger_zone(minions: List[Minion],
     dangerous_minions = []
     
     for minion in minions:
-        if not minion.positions:
-            continue
-            
         strategy_info = minion.get_strategy_info()
         if not strategy_info or not strategy_info.get('likely_enemy', False):
             continue
         
-        x, y = minion.positions[-1]
+        x, y = minion.last_position
         
         # Vérification selon le côté du joueur
         if player_side == "left" and x <= danger_zone_x:
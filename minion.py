@@ -4,15 +4,229 @@ Gère la détection, le suivi, la prédiction de trajectoire et la classificatio
 """
 
 import cv2
+import math
 import numpy as np
-from collections import deque
 import time
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from config import (
     MIN_LIFETIME, MIN_DISTANCE_TRAVELED, STATIONARY_THRESHOLD,
-    MIN_POINTS_FOR_PREDICTION, PREDICTION_TIME, PLAYER_SIDE
+    MIN_POINTS_FOR_PREDICTION, PREDICTION_TIME, PLAYER_SIDE,
+    KALMAN_PROCESS_NOISE, KALMAN_MEASUREMENT_NOISE
 )
 
+# Variances du filtre de Kalman à vitesse constante (état [x, y, vx, vy])
+_KF_Q_VAR = KALMAN_PROCESS_NOISE ** 2
+_KF_R_VAR = KALMAN_MEASUREMENT_NOISE ** 2
+# Covariance initiale : position connue à la mesure près, vitesse inconnue (jusqu'à ~200 px/s)
+_KF_P0 = np.diag([_KF_R_VAR, _KF_R_VAR, 200.0 ** 2, 200.0 ** 2])
+
+# Directions horizontales, codées en entiers (chaînes exposées via general_direction)
+_DIR_UNKNOWN, _DIR_LEFT, _DIR_RIGHT = 0, 1, 2
+_DIRECTION_NAMES = ("unknown", "left", "right")
+# Les ennemis se dirigent vers le côté du joueur
+_ENEMY_DIRECTION = _DIR_RIGHT if PLAYER_SIDE == "left" else _DIR_LEFT
+
+# Côtés de l'écran et ponts, codés par leur indice dans ces tables
+_SIDE_NAMES = ("left", "right")
+_BRIDGE_NAMES = ("top", "bottom", "unknown")
+_BRIDGE_UNKNOWN = 2
+
+# Nombre minimum de positions avant d'analyser la direction
+_MIN_POINTS_FOR_DIRECTION = 5
+
+# Seuil d'immobilité au carré (comparaison sans racine carrée)
+_STATIONARY_SQ = STATIONARY_THRESHOLD * STATIONARY_THRESHOLD
+
+# Nombre de positions conservées dans l'historique circulaire de chaque minion
+_HISTORY_LENGTH = 80
+
+# Demi-côté de la région d'intérêt utilisée pour les histogrammes (pixels)
+_HIST_ROI_HALF_SIZE = 25
+# Nombre de cases de l'histogramme de teinte et de saturation
+_HUE_BINS = 30
+_SAT_BINS = 32
+
+# Horizons de prédiction (secondes), fixes pour toute la durée du programme
+_DTS = np.arange(0.1, PREDICTION_TIME, 0.1)
+_PRED_STEPS = len(_DTS)
+_NO_PREDICTION = np.empty((0, 3))
+
+# ==============================================================================
+# --- NOYAUX NUMÉRIQUES (compilés avec Numba si disponible) ---
+# ==============================================================================
+
+# Matrices fixes de la version NumPy du filtre
+_KF_H = np.array([[1.0, 0.0, 0.0, 0.0],
+                  [0.0, 1.0, 0.0, 0.0]])
+_KF_I = np.eye(4)
+
+
+def _transition_matrix(dt):
+    """
+    Construit la matrice de transition du modèle à vitesse constante pour un intervalle donné.
+    
+    Args:
+        dt (float): Intervalle de temps depuis la dernière mesure (secondes)
+        
+    Returns:
+        np.array: Matrice 4x4 de transition
+    """
+    F = np.eye(4)
+    F[0, 2] = F[1, 3] = dt
+    return F
+
+
+def _kalman_step_numpy(state, cov, zx, zy, dt, q, r):
+    """Version NumPy de _kalman_step_kernel."""
+    # Prédiction
+    F = _transition_matrix(dt)
+    x = F @ state
+    P = F @ cov @ F.T + q * _KF_I
+    
+    # Correction par la mesure
+    y = np.array((zx, zy)) - _KF_H @ x
+    S = _KF_H @ P @ _KF_H.T + r * _KF_I[:2, :2]
+    K = P @ _KF_H.T @ np.linalg.inv(S)
+    state[:] = x + K @ y
+    cov[:] = (_KF_I - K @ _KF_H) @ P
+
+
+def _kalman_step_kernel(state, cov, zx, zy, dt, q, r):
+    """
+    Effectue une itération prédiction + correction du filtre de Kalman, en place.
+    Les produits matriciels sont développés pour le modèle à vitesse constante.
+    
+    Args:
+        state: État [x, y, vx, vy] (4,)
+        cov: Covariance de l'état (4, 4)
+        zx, zy: Position mesurée
+        dt: Temps écoulé depuis la mesure précédente (secondes)
+        q: Variance du bruit de processus
+        r: Variance du bruit de mesure
+    """
+    # Prédiction de l'état : x += vx*dt, y += vy*dt
+    state[0] += dt * state[2]
+    state[1] += dt * state[3]
+    
+    # Prédiction de la covariance : P = F P Fᵀ + Q
+    for j in range(4):
+        cov[0, j] += dt * cov[2, j]
+        cov[1, j] += dt * cov[3, j]
+    for i in range(4):
+        cov[i, 0] += dt * cov[i, 2]
+        cov[i, 1] += dt * cov[i, 3]
+        cov[i, i] += q
+    
+    # Gain de Kalman : K = P Hᵀ S⁻¹ avec S = H P Hᵀ + R (2x2)
+    s00 = cov[0, 0] + r
+    s01 = cov[0, 1]
+    s10 = cov[1, 0]
+    s11 = cov[1, 1] + r
+    inv_det = 1.0 / (s00 * s11 - s01 * s10)
+    i00 = s11 * inv_det
+    i01 = -s01 * inv_det
+    i10 = -s10 * inv_det
+    i11 = s00 * inv_det
+    
+    k = np.empty((4, 2))
+    for i in range(4):
+        k[i, 0] = cov[i, 0] * i00 + cov[i, 1] * i10
+        k[i, 1] = cov[i, 0] * i01 + cov[i, 1] * i11
+    
+    # Correction de l'état par l'innovation
+    y0 = zx - state[0]
+    y1 = zy - state[1]
+    for i in range(4):
+        state[i] += k[i, 0] * y0 + k[i, 1] * y1
+    
+    # Correction de la covariance : P = (I - K H) P
+    row0 = cov[0].copy()
+    row1 = cov[1].copy()
+    for i in range(4):
+        for j in range(4):
+            cov[i, j] -= k[i, 0] * row0[j] + k[i, 1] * row1[j]
+
+
+def _predict_trajectory_numpy(x, y, vx, vy, dts, width, height, current_time, out):
+    """Version NumPy de _predict_trajectory_kernel (calculs en place, sans temporaires)."""
+    for column, start, speed, limit in ((0, x, vx, width), (1, y, vy, height)):
+        values = out[:, column]
+        np.multiply(dts, speed, out=values)
+        values += start
+        np.clip(values, 0, limit, out=values)
+    np.add(dts, current_time, out=out[:, 2])
+
+
+def _predict_trajectory_kernel(x, y, vx, vy, dts, width, height, current_time, out):
+    """
+    Propage une trajectoire à vitesse constante sur tous les horizons de prédiction.
+    
+    Args:
+        x, y: Position de départ
+        vx, vy: Vitesse (pixels/s)
+        dts: Horizons de prédiction (secondes)
+        width, height: Limites de l'écran
+        current_time: Timestamp de départ
+        out: Tableau (N, 3) recevant x, y et timestamp de chaque horizon
+    """
+    for i in range(dts.shape[0]):
+        out[i, 0] = min(max(x + vx * dts[i], 0.0), width)
+        out[i, 1] = min(max(y + vy * dts[i], 0.0), height)
+        out[i, 2] = current_time + dts[i]
+
+
+if njit is not None:
+    kalman_step = njit(cache=True, fastmath=True)(_kalman_step_kernel)
+    predict_trajectory = njit(cache=True, fastmath=True)(_predict_trajectory_kernel)
+    # Compilation anticipée (évite la latence sur le premier minion suivi)
+    kalman_step(np.zeros(4), _KF_P0.copy(), 0.0, 0.0, 0.0, _KF_Q_VAR, _KF_R_VAR)
+    predict_trajectory(0.0, 0.0, 0.0, 0.0, _DTS, 1.0, 1.0, 0.0, np.empty((_PRED_STEPS, 3)))
+else:
+    kalman_step = _kalman_step_numpy
+    predict_trajectory = _predict_trajectory_numpy
+
+
+def precompute_hist_bins(frame, positions, hsv_buf, bins_buf):
+    """
+    Calcule, pour chaque pixel de la zone des détections, l'indice de sa case dans
+    l'histogramme teinte/saturation. La conversion HSV et la quantification sont faites
+    une seule fois par frame, sur le rectangle englobant toutes les régions d'intérêt ;
+    le résultat est écrit à la même place dans bins_buf, qui peut donc être découpé
+    avec les coordonnées de la frame.
+    
+    Args:
+        frame (np.array): Image BGR de la frame
+        positions (list): Positions (x, y) dont les histogrammes seront calculés
+        hsv_buf (np.array): Tampon de travail de même taille que la frame (3 canaux, uint8)
+        bins_buf (np.array): Tampon de même taille que la frame recevant les indices (uint16)
+        
+    Returns:
+        np.array: bins_buf, valide sur le rectangle englobant des régions d'intérêt
+    """
+    if not positions:
+        return bins_buf
+    
+    coords = np.asarray(positions)
+    height, width = frame.shape[:2]
+    x1 = max(0, int(coords[:, 0].min()) - _HIST_ROI_HALF_SIZE)
+    y1 = max(0, int(coords[:, 1].min()) - _HIST_ROI_HALF_SIZE)
+    x2 = min(width, int(coords[:, 0].max()) + _HIST_ROI_HALF_SIZE)
+    y2 = min(height, int(coords[:, 1].max()) + _HIST_ROI_HALF_SIZE)
+    
+    if x2 > x1 and y2 > y1:
+        hsv = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2HSV, dst=hsv_buf[y1:y2, x1:x2])
+        bins = bins_buf[y1:y2, x1:x2]
+        # Même découpage uniforme que calcHist : 30 cases sur [0, 180), 32 sur [0, 256)
+        np.floor_divide(hsv[..., 0], 180 // _HUE_BINS, out=bins, casting='unsafe')
+        bins *= _SAT_BINS
+        bins += hsv[..., 1] // (256 // _SAT_BINS)
+    return bins_buf
+
 
 class Minion:
     """
@@ -25,37 +239,64 @@ class Minion:
     - La validation comme vrai minion
     """
     
-    def __init__(self, id, position, frame, mask, frame_width, frame_height, timestamp):
+    # Attributs fixes : pas de dictionnaire par instance, accès plus rapide
+    __slots__ = (
+        # Identité et historique circulaire
+        'id', '_xs', '_ys', '_ts', '_n', '_head', 'creation_time', 'last_seen', 'active',
+        # Signature visuelle
+        'hist',
+        # Données spatiales et stratégiques
+        '_half_width', '_top_bridge_y', '_bottom_bridge_y', 'spawn_side', '_side',
+        '_direction', '_bridge', 'frame_width', 'frame_height',
+        'total_distance_traveled', 'original_classification',
+        # Validation et métriques de mouvement
+        'is_valid_minion', 'consecutive_stationary_frames', 'max_speed', '_analysis_xy',
+        # Prédiction de trajectoire et filtre de Kalman
+        '_predicted', '_pred_buf', '_pred_dirty', 'velocity', 'acceleration', '_kf_x', '_kf_P',
+    )
+    
+    def __init__(self, id, position, bin_frame, mask, frame_width, frame_height, timestamp, hist=None):
         """
         Initialise un nouveau minion.
         
         Args:
             id (int): Identifiant unique du minion
             position (tuple): Position initiale (x, y)
-            frame (np.array): Image de la frame actuelle
+            bin_frame (np.array): Indices de case d'histogramme de la frame actuelle (voir precompute_hist_bins)
             mask (np.array): Masque de détection
             frame_width (int): Largeur de l'écran
             frame_height (int): Hauteur de l'écran
             timestamp (float): Timestamp de création
+            hist (np.array): Histogramme déjà calculé pour cette position (optionnel)
         """
         # Identité et suivi
         self.id = id
-        self.positions = deque(maxlen=80)  # Historique des positions
-        self.timestamps = deque(maxlen=80)  # Historique des timestamps
-        self.positions.append(position)
-        self.timestamps.append(timestamp)
+        # Historique circulaire des positions et timestamps (une colonne par composante).
+        # Chaque entrée est écrite deux fois (i et i + _HISTORY_LENGTH) : les dernières
+        # entrées forment toujours une tranche contiguë, lue sans copie (voir _tail).
+        self._xs = np.empty(2 * _HISTORY_LENGTH, dtype=np.float32)
+        self._ys = np.empty(2 * _HISTORY_LENGTH, dtype=np.float32)
+        self._ts = np.empty(2 * _HISTORY_LENGTH, dtype=np.float64)
+        self._n = 0       # Nombre d'entrées valides
+        self._head = 0    # Prochain emplacement d'écriture
+        self._append(position, timestamp)
         self.creation_time = timestamp
         self.last_seen = timestamp
         self.active = True
         
         # Signature visuelle pour le ré-identification
-        self.hist = self.compute_hist(frame, mask, position)
+        self.hist = hist if hist is not None else self.compute_hist(bin_frame, mask, position)
+        
+        # Limites en pixels précalculées (milieu de l'écran, zones des ponts)
+        self._half_width = frame_width * 0.5
+        self._top_bridge_y = frame_height * 0.35
+        self._bottom_bridge_y = frame_height * 0.65
         
         # Données spatiales et stratégiques
-        self.spawn_side = "left" if position[0] < frame_width / 2 else "right"
-        self.current_side = self.spawn_side
-        self.general_direction = "unknown"
-        self.optimal_bridge = "unknown"
+        self._side = int(position[0] >= self._half_width)
+        self.spawn_side = _SIDE_NAMES[self._side]
+        self._direction = _DIR_UNKNOWN
+        self._bridge = _BRIDGE_UNKNOWN
         self.frame_width = frame_width
         self.frame_height = frame_height
         self.total_distance_traveled = 0
@@ -65,105 +306,159 @@ class Minion:
         self.is_valid_minion = False
         self.consecutive_stationary_frames = 0
         self.max_speed = 0
+        # Position lors du dernier recalcul de la direction et du pont
+        self._analysis_xy = (float(position[0]), float(position[1]))
         
         # Prédiction de trajectoire
-        self.predicted_positions = []
+        self._predicted = _NO_PREDICTION  # Tableau (N, 3) : x, y, timestamp
+        self._pred_buf = np.empty((_PRED_STEPS, 3))  # Réutilisé à chaque prédiction
+        self._pred_dirty = False  # Prédiction à recalculer à la prochaine lecture
         self.velocity = (0, 0)
-        self.acceleration = (0, 0)
+        self.acceleration = (0, 0)  # Toujours nulle avec le modèle à vitesse constante
+        
+        # État du filtre de Kalman [x, y, vx, vy] et sa covariance
+        self._kf_x = np.array([position[0], position[1], 0.0, 0.0])
+        self._kf_P = _KF_P0.copy()
+
+    def _append(self, position, timestamp):
+        """
+        Ajoute une position à l'historique circulaire (écrase la plus ancienne si plein).
+        
+        Args:
+            position (tuple): Position (x, y)
+            timestamp (float): Timestamp de la position
+        """
+        head = self._head
+        mirror = head + _HISTORY_LENGTH
+        self._xs[head] = self._xs[mirror] = position[0]
+        self._ys[head] = self._ys[mirror] = position[1]
+        self._ts[head] = self._ts[mirror] = timestamp
+        self._head = (head + 1) % _HISTORY_LENGTH
+        if self._n < _HISTORY_LENGTH:
+            self._n += 1
 
-    def compute_hist(self, frame, mask, position):
+    def _tail(self, k):
+        """
+        Retourne les k dernières entrées de l'historique, dans l'ordre chronologique.
+        Grâce à la copie miroir, il s'agit de vues sur les tampons (aucune copie).
+        
+        Args:
+            k (int): Nombre d'entrées souhaitées (borné par la taille de l'historique)
+            
+        Returns:
+            tuple: Vues (xs, ys, ts)
+        """
+        end = self._head + _HISTORY_LENGTH
+        start = end - min(k, self._n)
+        return self._xs[start:end], self._ys[start:end], self._ts[start:end]
+
+    @property
+    def last_position(self):
+        """tuple: Dernière position connue (x, y)."""
+        last = self._head - 1
+        return (float(self._xs[last]), float(self._ys[last]))
+
+    @property
+    def positions(self):
+        """np.array: Historique des positions (N, 2), de la plus ancienne à la plus récente."""
+        xs, ys, _ = self._tail(self._n)
+        return np.column_stack((xs, ys))
+
+    @property
+    def timestamps(self):
+        """np.array: Historique des timestamps, du plus ancien au plus récent."""
+        return self._tail(self._n)[2].copy()
+
+    @staticmethod
+    def compute_hist(bin_frame, mask, position):
         """
         Calcule l'histogramme de couleur autour de la position du minion.
-        Utilisé pour la ré-identification.
+        Utilisé pour la ré-identification. La conversion HSV et la quantification sont
+        faites une seule fois par l'appelant, pour toutes les détections.
         
         Args:
-            frame (np.array): Image de la frame
+            bin_frame (np.array): Indices de case d'histogramme de la frame (voir precompute_hist_bins)
             mask (np.array): Masque de détection
             position (tuple): Position (x, y) du minion
             
         Returns:
-            np.array: Histogramme HSV normalisé
+            np.array: Histogramme HSV centré et de norme unitaire (float32)
         """
         x, y = int(position[0]), int(position[1])
-        size = 25  # Taille de la région d'intérêt autour du minion
-        
-        # Définir la ROI en s'assurant qu'elle reste dans les limites de l'image
-        x1, y1 = max(0, x - size), max(0, y - size)
-        x2, y2 = min(frame.shape[1], x + size), min(frame.shape[0], y + size)
+        size = _HIST_ROI_HALF_SIZE
+        height, width = bin_frame.shape
         
-        # Vérifications de sécurité
-        if x2 <= x1 or y2 <= y1:
-            return np.zeros((30, 32))
+        if size <= x <= width - size and size <= y <= height - size:
+            # Cas courant : la ROI est entièrement dans l'image
+            x1, y1, x2, y2 = x - size, y - size, x + size, y + size
+        else:
+            # Près d'un bord : ROI tronquée aux limites de l'image
+            x1, y1 = max(0, x - size), max(0, y - size)
+            x2, y2 = min(width, x + size), min(height, y + size)
+            
+            # ROI vide (position hors de l'image)
+            if x2 <= x1 or y2 <= y1:
+                return np.zeros((_HUE_BINS, _SAT_BINS), dtype=np.float32)
             
-        roi = frame[y1:y2, x1:x2]
+        roi = bin_frame[y1:y2, x1:x2]
         roi_mask = mask[y1:y2, x1:x2]
         
-        if roi.size == 0 or roi_mask.size == 0:
-            return np.zeros((30, 32))
-            
-        # Conversion en HSV et calcul de l'histogramme
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
-        hist = cv2.calcHist([hsv], [0, 1], roi_mask, [30, 32], [0, 180, 0, 256])
-        cv2.normalize(hist, hist)
+        # Calcul de l'histogramme teinte/saturation par comptage des indices de case
+        hist = np.bincount(roi[roi_mask > 0], minlength=_HUE_BINS * _SAT_BINS)
+        hist = hist.astype(np.float32).reshape(_HUE_BINS, _SAT_BINS)
+        
+        # Centrage et normalisation unitaire : la corrélation entre deux histogrammes
+        # se réduit alors à un simple produit scalaire (voir compare_hist)
+        hist -= hist.mean()
+        norm = cv2.norm(hist)
+        if norm > 0:
+            hist *= 1.0 / norm
         return hist
 
+    def _kalman_update(self, position, dt):
+        """
+        Intègre une nouvelle mesure de position dans le filtre de Kalman.
+        
+        Args:
+            position (tuple): Position mesurée (x, y)
+            dt (float): Temps écoulé depuis la mesure précédente (secondes)
+        """
+        kalman_step(self._kf_x, self._kf_P, float(position[0]), float(position[1]),
+                    dt, _KF_Q_VAR, _KF_R_VAR)
+        self.velocity = (float(self._kf_x[2]), float(self._kf_x[3]))
+
     def calculate_prediction(self, current_time):
         """
-        Calcule la prédiction de trajectoire basée sur l'historique de mouvement.
-        Utilise la vitesse et l'accélération pour prédire les positions futures.
+        Calcule la prédiction de trajectoire à partir de l'état du filtre de Kalman.
+        L'état est propagé analytiquement (vitesse constante) sur tout l'horizon.
         
         Args:
             current_time (float): Timestamp actuel
         """
-        if len(self.positions) < MIN_POINTS_FOR_PREDICTION:
+        if self._n < MIN_POINTS_FOR_PREDICTION:
             return
+        
+        # Génération des positions prédites (une ligne x, y, timestamp par horizon)
+        vx, vy = self.velocity
+        if abs(vx) > 1 or abs(vy) > 1:  # Seulement si le minion bouge
+            # Les prédictions restent dans les limites de l'écran
+            predict_trajectory(float(self._kf_x[0]), float(self._kf_x[1]), vx, vy, _DTS,
+                               float(self.frame_width), float(self.frame_height),
+                               current_time, self._pred_buf)
+            self._predicted = self._pred_buf
+        else:
+            self._predicted = _NO_PREDICTION
 
-        # Utiliser les 10 dernières positions pour plus de stabilité
-        recent_positions = list(self.positions)[-10:]
-        recent_timestamps = list(self.timestamps)[-10:]
-        
-        # Calcul de la vitesse moyenne
-        if len(recent_positions) >= 3:
-            time_span = recent_timestamps[-1] - recent_timestamps[0]
-            if time_span > 0:
-                dx = recent_positions[-1][0] - recent_positions[0][0]
-                dy = recent_positions[-1][1] - recent_positions[0][1]
-                self.velocity = (dx / time_span, dy / time_span)
-                
-                # Calcul de l'accélération si on a assez de données
-                if len(recent_positions) >= 6:
-                    mid_idx = len(recent_positions) // 2
-                    time_span_1 = recent_timestamps[mid_idx] - recent_timestamps[0]
-                    time_span_2 = recent_timestamps[-1] - recent_timestamps[mid_idx]
-                    
-                    if time_span_1 > 0 and time_span_2 > 0:
-                        # Vitesse sur la première moitié
-                        vel1_x = (recent_positions[mid_idx][0] - recent_positions[0][0]) / time_span_1
-                        vel1_y = (recent_positions[mid_idx][1] - recent_positions[0][1]) / time_span_1
-                        
-                        # Vitesse sur la seconde moitié
-                        vel2_x = (recent_positions[-1][0] - recent_positions[mid_idx][0]) / time_span_2
-                        vel2_y = (recent_positions[-1][1] - recent_positions[mid_idx][1]) / time_span_2
-                        
-                        # Calcul de l'accélération
-                        accel_x = (vel2_x - vel1_x) / time_span_2
-                        accel_y = (vel2_y - vel1_y) / time_span_2
-                        self.acceleration = (accel_x, accel_y)
-        
-        # Génération des positions prédites
-        self.predicted_positions = []
-        if abs(self.velocity[0]) > 1 or abs(self.velocity[1]) > 1:  # Seulement si le minion bouge
-            last_pos = self.positions[-1]
-            for dt in np.arange(0.1, PREDICTION_TIME, 0.1):
-                # Équation cinématique : position = position_initiale + vitesse*temps + 0.5*accélération*temps²
-                pred_x = last_pos[0] + self.velocity[0] * dt + 0.5 * self.acceleration[0] * dt * dt
-                pred_y = last_pos[1] + self.velocity[1] * dt + 0.5 * self.acceleration[1] * dt * dt
-                
-                # S'assurer que la prédiction reste dans les limites de l'écran
-                pred_x = max(0, min(self.frame_width, pred_x))
-                pred_y = max(0, min(self.frame_height, pred_y))
-                
-                self.predicted_positions.append((pred_x, pred_y, current_time + dt))
+    @property
+    def predicted_positions(self):
+        """
+        np.array: Positions prédites (N, 3) : x, y, timestamp.
+        Recalculées à la demande, seulement si le minion a bougé depuis la dernière lecture.
+        """
+        if self._pred_dirty:
+            self._pred_dirty = False
+            self.calculate_prediction(float(self._ts[self._head - 1]))
+        return self._predicted
 
     def get_predicted_position_at_time(self, target_time):
         """
@@ -175,73 +470,89 @@ class Minion:
         Returns:
             tuple: Position prédite (x, y) ou None si impossible
         """
+        # Une prédiction existe-t-elle ? (sans générer la trajectoire si elle est à recalculer)
+        if self._pred_dirty:
+            vx, vy = self.velocity
+            has_prediction = self._n >= MIN_POINTS_FOR_PREDICTION and (abs(vx) > 1 or abs(vy) > 1)
+        else:
+            has_prediction = len(self._predicted) > 0
+        
         # Fallback si pas assez de données
-        if not self.predicted_positions or len(self.timestamps) < 2:
-            if len(self.positions) > 0:
-                return self.positions[-1]
-            return None
+        if not has_prediction or self._n < 2:
+            return self.last_position
 
-        # Extrapolation si le temps est dans le futur
-        last_pos = self.positions[-1]
-        dt = target_time - self.timestamps[-1]
-        pred_x = last_pos[0] + self.velocity[0] * dt + 0.5 * self.acceleration[0] * dt * dt
-        pred_y = last_pos[1] + self.velocity[1] * dt + 0.5 * self.acceleration[1] * dt * dt
-        return (pred_x, pred_y)
+        # Extrapolation de l'état filtré si le temps est dans le futur
+        dt = target_time - float(self._ts[self._head - 1])
+        return (float(self._kf_x[0]) + self.velocity[0] * dt, float(self._kf_x[1]) + self.velocity[1] * dt)
 
     def calculate_direction_and_bridge(self):
         """
         Analyse la direction générale du minion et détermine le pont optimal.
-        Met à jour les attributs general_direction et optimal_bridge.
+        Met à jour la direction, le côté actuel et le pont optimal.
         """
-        if len(self.positions) < 5:
+        if self._n < _MIN_POINTS_FOR_DIRECTION:
             return
         
+        # Indices de la plus ancienne et de la plus récente position de l'historique
+        first = (self._head - self._n) % _HISTORY_LENGTH
+        last = self._head - 1
+        
         # Déterminer la direction générale (gauche vers droite ou vice versa)
-        start_pos_x = self.positions[0][0]
-        current_pos_x = self.positions[-1][0]
-        horizontal_movement = current_pos_x - start_pos_x
+        horizontal_movement = float(self._xs[last] - self._xs[first])
 
         # Seuil de mouvement significatif
         if abs(horizontal_movement) > 50:
-            self.general_direction = "right" if horizontal_movement > 0 else "left"
+            self._direction = _DIR_RIGHT if horizontal_movement > 0 else _DIR_LEFT
         
         # Classification initiale comme ennemi (fait une seule fois)
-        if self.original_classification is None and self.general_direction != "unknown":
+        if self.original_classification is None and self._direction != _DIR_UNKNOWN:
             self.original_classification = self.classify_as_enemy()
 
         # Mise à jour du côté actuel
-        self.current_side = "left" if self.positions[-1][0] < self.frame_width / 2 else "right"
-        
-        # Déterminer le pont optimal basé sur la position verticale
-        current_y = self.positions[-1][1]
-        vertical_ratio = current_y / self.frame_height
-        vertical_trend = self.positions[-1][1] - self.positions[0][1]
+        self._side = int(self._xs[last] >= self._half_width)
         
-        if vertical_ratio < 0.35:
-            self.optimal_bridge = "top"
-        elif vertical_ratio > 0.65:
-            self.optimal_bridge = "bottom"
-        else:
-            # Position centrale, utiliser la tendance de mouvement
-            self.optimal_bridge = "top" if vertical_trend <= 0 else "bottom"
+        # Déterminer le pont optimal basé sur la position verticale : bas sous la zone
+        # centrale, et dans la zone centrale si le minion descend ; haut sinon
+        current_y = float(self._ys[last])
+        vertical_trend = current_y - float(self._ys[first])
+        self._bridge = int((current_y > self._bottom_bridge_y)
+                           | ((current_y >= self._top_bridge_y) & (vertical_trend > 0)))
+
+    @property
+    def current_side(self):
+        """str: Côté de l'écran où se trouve le minion ("left" ou "right")."""
+        return _SIDE_NAMES[self._side]
+
+    @property
+    def optimal_bridge(self):
+        """str: Pont à privilégier ("top", "bottom" ou "unknown")."""
+        return _BRIDGE_NAMES[self._bridge]
+
+    @property
+    def general_direction(self):
+        """str: Direction générale du minion ("left", "right" ou "unknown")."""
+        return _DIRECTION_NAMES[self._direction]
 
     def classify_as_enemy(self):
         """
         Détermine si ce minion est un ennemi basé sur sa direction de mouvement.
+        Si le joueur est à gauche, les ennemis vont vers la droite, et inversement.
         
         Returns:
             bool: True si c'est probablement un ennemi
         """
-        if self.general_direction == "unknown":
-            return False
-            
-        # Logique basée sur le côté du joueur
-        if PLAYER_SIDE == "left":
-            # Si le joueur est à gauche, les ennemis vont vers la droite
-            return self.general_direction == "right"
-        else:  # PLAYER_SIDE == "right"
-            # Si le joueur est à droite, les ennemis vont vers la gauche
-            return self.general_direction == "left"
+        return self._direction == _ENEMY_DIRECTION
+
+    def is_likely_enemy(self):
+        """
+        Indique si ce minion est probablement un ennemi.
+        La classification originale est figée dès que la direction est connue ;
+        avant cela, la direction est inconnue et le minion n'est pas un ennemi.
+        
+        Returns:
+            bool: True si c'est probablement un ennemi
+        """
+        return self.original_classification is True
 
     def validate_as_minion(self, current_time):
         """
@@ -265,62 +576,146 @@ class Minion:
         
         return self.is_valid_minion
 
-    def update_position(self, position, frame, mask, timestamp):
+    def update_position(self, position, bin_frame, mask, timestamp, hist=None):
         """
         Met à jour la position du minion et recalcule toutes les métriques.
         
         Args:
             position (tuple): Nouvelle position (x, y)
-            frame (np.array): Image de la frame
+            bin_frame (np.array): Indices de case d'histogramme de la frame (voir precompute_hist_bins)
             mask (np.array): Masque de détection
             timestamp (float): Timestamp de la mise à jour
+            hist (np.array): Histogramme déjà calculé pour cette position (optionnel)
         """
         # Calcul des métriques de mouvement
-        last_pos = self.positions[-1]
-        distance = np.hypot(position[0] - last_pos[0], position[1] - last_pos[1])
-        time_diff = timestamp - self.timestamps[-1]
+        last = self._head - 1
+        dx = position[0] - float(self._xs[last])
+        dy = position[1] - float(self._ys[last])
+        dist_sq = dx * dx + dy * dy
+        time_diff = timestamp - float(self._ts[last])
+        
+        self._apply_update(position, dist_sq, math.sqrt(dist_sq), time_diff,
+                           bin_frame, mask, timestamp, hist)
+
+    @classmethod
+    def batch_update(cls, minions, positions, bin_frame, mask, timestamp, hists=None):
+        """
+        Met à jour plusieurs minions à la fois (une nouvelle position chacun).
+        Les métriques de mouvement sont calculées en une seule passe vectorisée ;
+        seules les mises à jour d'état propres à chaque minion restent individuelles.
+        
+        Args:
+            minions (list): Minions à mettre à jour
+            positions (np.array): Nouvelles positions (M, 2), une ligne par minion
+            bin_frame (np.array): Indices de case d'histogramme de la frame (voir precompute_hist_bins)
+            mask (np.array): Masque de détection
+            timestamp (float): Timestamp de la mise à jour
+            hists (list): Histogrammes déjà calculés pour chaque position (optionnel)
+        """
+        if not minions:
+            return
+        
+        # Dernière entrée de l'historique de chaque minion (x, y, t)
+        last_states = np.array([(m._xs[m._head - 1], m._ys[m._head - 1], m._ts[m._head - 1])
+                                for m in minions])
+        
+        # Calcul des métriques de mouvement pour tous les minions
+        deltas = positions - last_states[:, :2]
+        dists_sq = np.einsum('ij,ij->i', deltas, deltas)
+        distances = np.sqrt(dists_sq)
+        time_diffs = timestamp - last_states[:, 2]
         
+        for i, minion in enumerate(minions):
+            minion._apply_update((float(positions[i, 0]), float(positions[i, 1])),
+                                 float(dists_sq[i]), float(distances[i]), float(time_diffs[i]),
+                                 bin_frame, mask, timestamp,
+                                 hists[i] if hists is not None else None)
+
+    def _apply_update(self, position, dist_sq, distance, time_diff, bin_frame, mask, timestamp, hist):
+        """
+        Applique une nouvelle position dont les métriques de mouvement sont déjà calculées.
+        
+        Args:
+            position (tuple): Nouvelle position (x, y)
+            dist_sq (float): Distance au carré depuis la position précédente
+            distance (float): Distance depuis la position précédente
+            time_diff (float): Temps écoulé depuis la position précédente
+            bin_frame (np.array): Indices de case d'histogramme de la frame (voir precompute_hist_bins)
+            mask (np.array): Masque de détection
+            timestamp (float): Timestamp de la mise à jour
+            hist (np.array): Histogramme déjà calculé pour cette position (ou None)
+        """
         if time_diff > 0:
             speed = distance / time_diff
             self.max_speed = max(self.max_speed, speed)
             
             # Suivi des frames stationnaires
-            if distance < STATIONARY_THRESHOLD:
+            if dist_sq < _STATIONARY_SQ:
                 self.consecutive_stationary_frames += 1
             else:
                 self.consecutive_stationary_frames = 0
         
+        # Mise à jour du filtre de Kalman avec la nouvelle mesure
+        self._kalman_update(position, max(time_diff, 0.0))
+        # La vitesse a changé : la trajectoire prédite sera régénérée à la prochaine lecture
+        self._pred_dirty = True
+        
         # Mise à jour des données
         self.total_distance_traveled += distance
-        self.positions.append(position)
-        self.timestamps.append(timestamp)
+        self._append(position, timestamp)
         self.last_seen = timestamp
         self.active = True
         
         # Mise à jour de la signature visuelle
-        self.hist = self.compute_hist(frame, mask, position)
+        self.hist = hist if hist is not None else self.compute_hist(bin_frame, mask, position)
+        
+        # Minion immobile depuis plusieurs frames et resté près de la position du
+        # dernier recalcul : direction et pont ne peuvent pas avoir changé. Le
+        # déplacement est cumulé depuis ce recalcul, un minion lent mais régulier
+        # finit donc toujours par être réanalysé.
+        ax, ay = self._analysis_xy
+        dx = position[0] - ax
+        dy = position[1] - ay
+        if self.consecutive_stationary_frames > 3 and dx * dx + dy * dy < _STATIONARY_SQ:
+            return
         
-        # Recalcul des analyses stratégiques
-        self.calculate_direction_and_bridge()
-        self.calculate_prediction(timestamp)
+        # Recalcul des analyses stratégiques (seulement avec assez d'historique)
+        if self._n >= _MIN_POINTS_FOR_DIRECTION:
+            self.calculate_direction_and_bridge()
+            self._analysis_xy = (float(position[0]), float(position[1]))
 
-    def similarity(self, frame, mask, position):
+    def similarity(self, bin_frame, mask, position, hist=None):
         """
         Calcule la similarité entre ce minion et une nouvelle détection.
         Utilisé pour la ré-identification.
         
         Args:
-            frame (np.array): Image de la frame
+            bin_frame (np.array): Indices de case d'histogramme de la frame (voir precompute_hist_bins)
             mask (np.array): Masque de détection
             position (tuple): Position de la nouvelle détection
+            hist (np.array): Histogramme déjà calculé pour cette détection (optionnel)
+            
+        Returns:
+            float: Score de similarité (0-1, plus haut = plus similaire)
+        """
+        if hist is None:
+            hist = self.compute_hist(bin_frame, mask, position)
+        return self.compare_hist(hist)
+
+    def compare_hist(self, hist):
+        """
+        Compare la signature de ce minion avec un histogramme déjà calculé.
+        
+        Args:
+            hist (np.array): Histogramme HSV d'une détection (voir compute_hist)
             
         Returns:
             float: Score de similarité (0-1, plus haut = plus similaire)
         """
-        hist = self.compute_hist(frame, mask, position)
         if hist is None or self.hist is None:
             return 0
-        return cv2.compareHist(self.hist, hist, cv2.HISTCMP_CORREL)
+        # Histogrammes centrés et unitaires : le produit scalaire vaut HISTCMP_CORREL
+        return float(np.dot(self.hist.ravel(), hist.ravel()))
 
     def get_strategy_info(self):
         """
@@ -332,13 +727,8 @@ class Minion:
         if not self.is_valid_minion:
             return None
             
-        # Utiliser la classification originale si disponible, sinon recalculer
-        is_enemy = (self.original_classification 
-                   if self.original_classification is not None 
-                   else self.classify_as_enemy())
-        
         return {
-            'likely_enemy': is_enemy,
+            'likely_enemy': self.is_likely_enemy(),
             'direction': self.general_direction,
             'optimal_bridge': self.optimal_bridge,
             'current_side': self.current_side,
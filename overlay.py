@@ -4,13 +4,61 @@ Ce module gère la superposition transparente Tkinter qui affiche les suggestion
 """
 
 import tkinter as tk
-from typing import Optional, Tuple, List, Callable
+from typing import Optional, Tuple, List, Callable, Dict
+import ctypes
+import platform
 import threading
-import queue
 import time
+import logging
+from collections import deque
+from math import isfinite
+
+import numpy as np
 
 import config
 
+log = logging.getLogger(__name__)
+
+# Styles étendus Win32 pour une fenêtre superposée transparente aux clics
+GWL_EXSTYLE = -20
+WS_EX_LAYERED = 0x00080000
+WS_EX_TRANSPARENT = 0x00000020
+WS_EX_NOACTIVATE = 0x08000000
+
+# Index GetDeviceCaps de la fréquence de rafraîchissement verticale (Hz)
+VREFRESH = 116
+
+# Sensibilité DPI par moniteur (shcore.SetProcessDpiAwareness)
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+
+# Nombre de segments du polygone qui trace le cercle de suggestion
+_SUGGESTION_CIRCLE_SEGMENTS = 32
+
+# Taille maximale de la file des mises à jour de marqueurs
+_UPDATE_QUEUE_MAXLEN = 1024
+
+
+def detect_refresh_rate() -> Optional[float]:
+    """
+    Lit la fréquence de rafraîchissement de l'écran principal.
+    
+    Returns:
+        Optional[float]: Fréquence en Hz, ou None si inconnue (hors Windows ou
+        valeur par défaut du pilote)
+    """
+    if platform.system() != "Windows":
+        return None
+    
+    user32 = ctypes.windll.user32
+    hdc = user32.GetDC(0)
+    try:
+        hz = ctypes.windll.gdi32.GetDeviceCaps(hdc, VREFRESH)
+    finally:
+        user32.ReleaseDC(0, hdc)
+    
+    # 0 et 1 désignent la fréquence par défaut du matériel
+    return float(hz) if hz > 1 else None
+
 
 class GameOverlay:
     """
@@ -22,6 +70,23 @@ class GameOverlay:
         """Initialise l'overlay avec tous les paramètres nécessaires."""
         self.frame_width = config.MONITOR["width"]
         self.frame_height = config.MONITOR["height"]
+        self._sugg_radius = config.SUGGESTION_CIRCLE_RADIUS
+        
+        # Géométrie fixe des zones d'exclusion (boîtes englobantes des cercles)
+        exc_r = int(self.frame_width * config.EXCLUSION_RADIUS_RATIO)
+        exc_cy = int(self.frame_height * config.EXCLUSION_CENTER_Y_RATIO)
+        self._exc_left_bbox = (0, exc_cy - exc_r, exc_r * 2, exc_cy + exc_r)
+        self._exc_right_bbox = (
+            self.frame_width - exc_r * 2, exc_cy - exc_r,
+            self.frame_width, exc_cy + exc_r
+        )
+        
+        # Sommets du cercle de suggestion relatifs à son centre (rayon inclus)
+        angles = np.linspace(0.0, 2.0 * np.pi, _SUGGESTION_CIRCLE_SEGMENTS, endpoint=False)
+        self._sugg_offsets = list(zip(
+            (np.cos(angles) * self._sugg_radius).tolist(),
+            (np.sin(angles) * self._sugg_radius).tolist()
+        ))
         
         # Interface Tkinter
         self.root = None
@@ -29,25 +94,65 @@ class GameOverlay:
         self.suggestion_circle = None
         self.debug_elements = []
         
+        # Marqueurs de minions réutilisés : item du canvas par ID de minion,
+        # style affiché (couleur, état) par item, et items libres masqués
+        self._minion_markers: Dict[int, int] = {}
+        self._marker_styles: Dict[int, Tuple[str, str]] = {}
+        self._marker_pool: List[int] = []
+        
         # État de l'overlay
         self.is_running = False
         self.show_debug = False
         
+        # Signalé quand la fenêtre est prête (ou quand son démarrage a échoué)
+        self.ready = threading.Event()
+        
         # Communication thread-safe
-        self.update_queue = queue.Queue()
+        # Suggestion et mode debug : seule la dernière valeur compte, elle est
+        # déposée dans un emplacement unique protégé par un verrou
+        self._state_lock = threading.Lock()
+        self._latest_suggestion: Optional[Tuple[float, float]] = None
+        self._latest_suggestion_dirty = False
+        self._latest_debug = False
+        self._latest_debug_dirty = False
+        self._last_drawn_suggestion: Optional[Tuple[float, float]] = None
+        # Effacement des marqueurs demandé : un simple drapeau, il ne peut pas
+        # être écarté de la file comme un événement lorsqu'elle déborde
+        self._clear_pending = False
+        
+        # Vrai lorsqu'un élément du canvas a été modifié depuis le dernier rendu
+        self._dirty = False
+        
+        # Les marqueurs de minions ne peuvent pas être fusionnés : file d'attente.
+        # append d'une deque est atomique, aucun verrou n'est nécessaire pour ajouter
+        self.update_queue = deque(maxlen=_UPDATE_QUEUE_MAXLEN)
+        
+        # Budget d'un tick de la boucle Tk : une image de l'écran, pour ne rien
+        # dessiner que le compositeur ne pourrait afficher (FRAME_DELAY par défaut)
+        refresh_rate = detect_refresh_rate()
+        self._frame_budget = 1.0 / refresh_rate if refresh_rate else config.FRAME_DELAY
         
         # Callbacks
         self.on_close_callback: Optional[Callable] = None
         
-        print("🎨 Overlay initialisé")
+        log.info("🎨 Overlay initialisé")
     
     def setup_window(self):
         """Configure la fenêtre principale de l'overlay."""
+        # Doit précéder la création de la fenêtre pour que Tk travaille en pixels physiques
+        self._enable_dpi_awareness()
+        
         self.root = tk.Tk()
         self.root.title("Minion Masters Assistant")
+        self.root.report_callback_exception = self._report_callback_exception
         
         # Configuration de la fenêtre
-        self.root.geometry(f"{self.frame_width}x{self.frame_height}+0+0")
+        # La fenêtre recouvre exactement la zone capturée : les coordonnées du
+        # canvas sont celles du détecteur
+        self.root.geometry(
+            f"{self.frame_width}x{self.frame_height}"
+            f"+{config.MONITOR['left']}+{config.MONITOR['top']}"
+        )
         self.root.attributes('-topmost', True)  # Toujours au premier plan
         self.root.attributes('-transparentcolor', config.TRANSPARENT_COLOR)  # Transparence
         self.root.overrideredirect(True)  # Supprime les bordures de fenêtre
@@ -65,18 +170,74 @@ class GameOverlay:
         )
         self.canvas.pack()
         
+        # Méthodes du canvas liées une fois pour le chemin de mise à jour
+        canvas = self.canvas
+        self._coords = canvas.coords
+        self._itemconfig = canvas.itemconfig
+        self._itemconfigure_tag = canvas.itemconfigure
+        self._create_oval = canvas.create_oval
+        
+        # Accès direct à l'interpréteur Tcl pour les mises à jour groupées
+        self._canvas_path = str(self.canvas)
+        self._tk_eval = self.root.tk.eval
+        
         # Création des éléments graphiques
         self._create_ui_elements()
         
-        print(f"✅ Fenêtre overlay configurée ({self.frame_width}x{self.frame_height})")
+        # Fenêtre layered transparente aux clics (Windows)
+        self._apply_layered_style()
+        
+        log.info("✅ Fenêtre overlay configurée (%dx%d)", self.frame_width, self.frame_height)
+        self.ready.set()
+    
+    @staticmethod
+    def _enable_dpi_awareness():
+        """
+        Sous Windows, déclare le processus sensible au DPI par moniteur : sans cela,
+        avec une mise à l'échelle différente de 100 %, le système agrandit la
+        fenêtre par étirement bitmap et l'overlay ne correspond plus aux pixels
+        capturés. Sans effet sur les autres plateformes.
+        """
+        if platform.system() != "Windows":
+            return
+        
+        try:
+            ctypes.windll.shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE)
+        except (AttributeError, OSError):
+            # Windows antérieur à 8.1 : sensibilité DPI système uniquement
+            ctypes.windll.user32.SetProcessDPIAware()
+    
+    def _apply_layered_style(self):
+        """
+        Sous Windows, ajoute WS_EX_LAYERED | WS_EX_TRANSPARENT | WS_EX_NOACTIVATE
+        à la fenêtre : le compositeur la traite comme une couche superposée, les
+        clics passent directement au jeu et l'overlay ne prend jamais le focus.
+        Sans effet sur les autres plateformes.
+        """
+        if platform.system() != "Windows":
+            return
+        
+        # La fenêtre doit exister côté système avant de modifier son style
+        self.root.update_idletasks()
+        
+        user32 = ctypes.windll.user32
+        hwnd = user32.GetParent(self.root.winfo_id())
+        style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+        user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_LAYERED | WS_EX_TRANSPARENT | WS_EX_NOACTIVATE)
+        
+        # Tk ne doit pas non plus traiter les entrées de la fenêtre
+        self.root.wm_attributes('-disabled', True)
     
     def _create_ui_elements(self):
         """Crée tous les éléments graphiques de l'overlay."""
-        # Cercle de suggestion principal
-        self.suggestion_circle = self.canvas.create_oval(
-            0, 0, 0, 0,
+        # Cercle de suggestion principal, tracé comme un polygone fermé à nombre
+        # de sommets fixe : un déplacement ne demande qu'un appel coords()
+        self.suggestion_circle = self.canvas.create_polygon(
+            *([0] * (2 * _SUGGESTION_CIRCLE_SEGMENTS)),
             outline=config.SUGGESTION_CIRCLE_COLOR,
+            fill='',
             width=config.SUGGESTION_CIRCLE_WIDTH,
+            joinstyle='round',
             state='hidden'
         )
         
@@ -85,22 +246,14 @@ class GameOverlay:
     
     def _create_debug_elements(self):
         """Crée les éléments de debug (zones d'exclusion, positions stratégiques, etc.)."""
-        # Zones d'exclusion
-        exclusion_radius = self.frame_width * config.EXCLUSION_RADIUS_RATIO
-        center_y = self.frame_height * config.EXCLUSION_CENTER_Y_RATIO
-        
-        # Zone d'exclusion gauche
+        # Zones d'exclusion gauche et droite
         left_exclusion = self.canvas.create_oval(
-            0, center_y - exclusion_radius,
-            exclusion_radius * 2, center_y + exclusion_radius,
-            outline='red', width=2, state='hidden'
+            *self._exc_left_bbox,
+            outline='red', width=2, state='hidden', tags=('debug', 'exclusion')
         )
-        
-        # Zone d'exclusion droite
         right_exclusion = self.canvas.create_oval(
-            self.frame_width - exclusion_radius * 2, center_y - exclusion_radius,
-            self.frame_width, center_y + exclusion_radius,
-            outline='red', width=2, state='hidden'
+            *self._exc_right_bbox,
+            outline='red', width=2, state='hidden', tags=('debug', 'exclusion')
         )
         
         self.debug_elements.extend([left_exclusion, right_exclusion])
@@ -110,49 +263,29 @@ class GameOverlay:
     
     def _create_strategic_positions_debug(self):
         """Crée les marqueurs de debug pour les positions stratégiques."""
-        from utils import ratio_to_pixels
-        
-        # Positions défensives (bleu)
-        defensive_positions = ratio_to_pixels(
-            config.DEFENSIVE_POSITIONS_RATIOS, 
-            self.frame_width, 
-            self.frame_height
-        )
-        for x, y in defensive_positions:
-            marker = self.canvas.create_oval(
-                x - 5, y - 5, x + 5, y + 5,
-                outline='blue', width=2, fill='blue',
-                state='hidden'
-            )
-            self.debug_elements.append(marker)
-        
-        # Positions offensives (rouge)
-        offensive_positions = ratio_to_pixels(
-            config.OFFENSIVE_POSITIONS_RATIOS, 
-            self.frame_width, 
-            self.frame_height
+        # Défensives en bleu, offensives en rouge, centrales en vert
+        groups = (
+            (config.DEFENSIVE_POSITIONS_RATIOS, 'blue'),
+            (config.OFFENSIVE_POSITIONS_RATIOS, 'red'),
+            (config.CENTRAL_POSITIONS_RATIOS, 'green'),
         )
-        for x, y in offensive_positions:
-            marker = self.canvas.create_oval(
-                x - 5, y - 5, x + 5, y + 5,
-                outline='red', width=2, fill='red',
-                state='hidden'
-            )
-            self.debug_elements.append(marker)
         
-        # Positions centrales (vert)
-        central_positions = ratio_to_pixels(
-            config.CENTRAL_POSITIONS_RATIOS, 
-            self.frame_width, 
-            self.frame_height
-        )
-        for x, y in central_positions:
-            marker = self.canvas.create_oval(
+        # Conversion de tous les ratios en pixels en une seule opération
+        all_ratios = np.concatenate([
+            np.asarray(ratios, dtype=np.float32).reshape(-1, 2) for ratios, _ in groups
+        ])
+        scale = np.array([self.frame_width, self.frame_height], dtype=np.float32)
+        pixels = (all_ratios * scale).astype(np.int32).tolist()
+        colors = [color for ratios, color in groups for _ in ratios]
+        
+        create_oval = self.canvas.create_oval
+        append = self.debug_elements.append
+        for (x, y), color in zip(pixels, colors):
+            append(create_oval(
                 x - 5, y - 5, x + 5, y + 5,
-                outline='green', width=2, fill='green',
-                state='hidden'
-            )
-            self.debug_elements.append(marker)
+                outline=color, width=2, fill=color,
+                state='hidden', tags=('debug', 'strategic', color)
+            ))
     
     def update_suggestion(self, position: Optional[Tuple[float, float]]):
         """
@@ -161,19 +294,17 @@ class GameOverlay:
         Args:
             position: Coordonnées (x, y) de la suggestion, ou None pour masquer
         """
-        try:
-            self.update_queue.put(('suggestion', position), block=False)
-        except queue.Full:
-            pass  # Ignore si la queue est pleine
+        with self._state_lock:
+            self._latest_suggestion = position
+            self._latest_suggestion_dirty = True
     
     def toggle_debug_mode(self):
         """Active/désactive l'affichage des éléments de debug."""
         self.show_debug = not self.show_debug
-        try:
-            self.update_queue.put(('debug_toggle', self.show_debug), block=False)
-        except queue.Full:
-            pass
-        print(f"🔧 Mode debug: {'ACTIVÉ' if self.show_debug else 'DÉSACTIVÉ'}")
+        with self._state_lock:
+            self._latest_debug = self.show_debug
+            self._latest_debug_dirty = True
+        log.info("🔧 Mode debug: %s", 'ACTIVÉ' if self.show_debug else 'DÉSACTIVÉ')
     
     def add_minion_marker(self, minion_id: int, position: Tuple[float, float], 
                          is_enemy: bool = False, is_predicted: bool = False):
@@ -186,114 +317,162 @@ class GameOverlay:
             is_enemy: True si c'est un ennemi
             is_predicted: True si c'est une position prédite
         """
-        if not self.show_debug:
-            return
-        
-        try:
-            self.update_queue.put(('minion_marker', {
-                'id': minion_id,
-                'position': position,
-                'is_enemy': is_enemy,
-                'is_predicted': is_predicted
-            }), block=False)
-        except queue.Full:
-            pass
+        # Aucun try/except : append sur une deque bornée ne peut pas échouer,
+        # les plus anciens événements sont écartés si l'overlay prend du retard
+        if self.show_debug:
+            self.update_queue.append(
+                ('minion_marker', (minion_id, position, is_enemy, is_predicted))
+            )
     
     def clear_minion_markers(self):
         """Efface tous les marqueurs de minions."""
-        try:
-            self.update_queue.put(('clear_markers', None), block=False)
-        except queue.Full:
-            pass
+        # Les marqueurs en attente sont antérieurs à l'effacement : ils sont
+        # abandonnés, sous le verrou pour ne pas s'intercaler avec le vidage
+        with self._state_lock:
+            self.update_queue.clear()
+            self._clear_pending = True
     
     def _process_updates(self):
-        """Traite toutes les mises à jour en attente dans la queue."""
-        try:
-            while True:
-                try:
-                    update_type, data = self.update_queue.get_nowait()
-                    
-                    if update_type == 'suggestion':
-                        self._update_suggestion_display(data)
-                    elif update_type == 'debug_toggle':
-                        self._toggle_debug_display(data)
-                    elif update_type == 'minion_marker':
-                        self._add_minion_marker_display(data)
-                    elif update_type == 'clear_markers':
-                        self._clear_minion_markers_display()
-                    
-                except queue.Empty:
-                    break
-                    
-        except Exception as e:
-            print(f"⚠️  Erreur lors du traitement des mises à jour: {e}")
+        """
+        Traite toutes les mises à jour en attente en un seul lot : la queue est
+        vidée entièrement, les marqueurs sont fusionnés par minion (au plus un
+        dessin par minion et par tick), puis les changements sont appliqués.
+        """
+        # Récupère les dernières valeurs déposées par les producteurs
+        markers_by_id = {}
+        with self._state_lock:
+            suggestion_dirty = self._latest_suggestion_dirty
+            suggestion = self._latest_suggestion
+            debug_dirty = self._latest_debug_dirty
+            show_debug = self._latest_debug
+            clear_pending = self._clear_pending
+            self._latest_suggestion_dirty = False
+            self._latest_debug_dirty = False
+            self._clear_pending = False
+            
+            # Vidage complet de la queue sous le verrou : un effacement ne peut pas
+            # s'intercaler, les marqueurs restants sont tous postérieurs au dernier
+            update_queue = self.update_queue
+            while update_queue:
+                data = update_queue.popleft()[1]
+                markers_by_id[data[0]] = data
+        
+        # Application du lot
+        if clear_pending:
+            self._clear_minion_markers_display()
+        if markers_by_id:
+            self._add_minion_markers_display(list(markers_by_id.values()))
+        if debug_dirty:
+            self._toggle_debug_display(show_debug)
+        # Redessine uniquement si la valeur a réellement changé
+        if suggestion_dirty and suggestion != self._last_drawn_suggestion:
+            self._update_suggestion_display(suggestion)
+            self._last_drawn_suggestion = suggestion
     
     def _update_suggestion_display(self, position: Optional[Tuple[float, float]]):
         """Met à jour l'affichage du cercle de suggestion."""
         if position is None:
-            self.canvas.itemconfig(self.suggestion_circle, state='hidden')
+            self._itemconfig(self.suggestion_circle, state='hidden')
         else:
             x, y = position
-            radius = config.SUGGESTION_CIRCLE_RADIUS
             
-            # Mise à jour des coordonnées
-            self.canvas.coords(
-                self.suggestion_circle,
-                x - radius, y - radius,
-                x + radius, y + radius
-            )
-            self.canvas.itemconfig(self.suggestion_circle, state='normal')
+            # Mise à jour des sommets du polygone
+            self._coords(self.suggestion_circle, [
+                coord for dx, dy in self._sugg_offsets for coord in (x + dx, y + dy)
+            ])
+            # Le cercle n'est à réafficher que s'il était masqué
+            if self._last_drawn_suggestion is None:
+                self._itemconfig(self.suggestion_circle, state='normal')
+        
+        self._dirty = True
     
     def _toggle_debug_display(self, show_debug: bool):
         """Active/désactive l'affichage des éléments de debug."""
-        state = 'normal' if show_debug else 'hidden'
-        for element in self.debug_elements:
-            self.canvas.itemconfig(element, state=state)
-    
-    def _add_minion_marker_display(self, marker_data: dict):
-        """Ajoute un marqueur de minion à l'affichage."""
-        if not hasattr(self, '_minion_markers'):
-            self._minion_markers = {}
-        
-        minion_id = marker_data['id']
-        x, y = marker_data['position']
-        is_enemy = marker_data['is_enemy']
-        is_predicted = marker_data['is_predicted']
-        
-        # Couleur selon le type
-        if is_predicted:
-            color = 'yellow'
-            size = 3
-        elif is_enemy:
-            color = 'red'
-            size = 4
-        else:
-            color = 'cyan'
-            size = 4
-        
-        # Supprime l'ancien marqueur s'il existe
-        if minion_id in self._minion_markers:
-            self.canvas.delete(self._minion_markers[minion_id])
-        
-        # Crée le nouveau marqueur
-        marker = self.canvas.create_oval(
-            x - size, y - size, x + size, y + size,
-            outline=color, width=2, fill=color,
-            state='normal' if self.show_debug else 'hidden'
-        )
+        # Un seul appel Tcl pour tous les éléments portant le tag 'debug'
+        self._itemconfigure_tag('debug', state='normal' if show_debug else 'hidden')
+        self._dirty = True
+    
+    def _add_minion_markers_display(self, markers: List[tuple]):
+        """
+        Affiche les marqueurs d'un lot de minions. Un nouveau minion reprend un
+        oval de la réserve avant d'en créer un : les déplacements et changements
+        de style sont regroupés dans un seul script Tcl évalué d'un coup.
+        """
+        canvas_path = self._canvas_path
+        state = 'normal' if self.show_debug else 'hidden'
+        markers_by_id = self._minion_markers
+        marker_styles = self._marker_styles
+        marker_pool = self._marker_pool
+        script = []
+        
+        for minion_id, (x, y), is_enemy, is_predicted in markers:
+            # Une coordonnée non finie (nan, inf) ferait échouer tout le script Tcl
+            if not (isfinite(x) and isfinite(y)):
+                continue
+            
+            # Couleur selon le type
+            if is_predicted:
+                color = 'yellow'
+                size = 3
+            elif is_enemy:
+                color = 'red'
+                size = 4
+            else:
+                color = 'cyan'
+                size = 4
+            
+            style = (color, state)
+            marker = markers_by_id.get(minion_id)
+            if marker is None and marker_pool:
+                marker = marker_pool.pop()
+                markers_by_id[minion_id] = marker
+            
+            if marker is None:
+                # La création doit renvoyer l'ID de l'item : appel direct
+                marker = self._create_oval(
+                    x - size, y - size, x + size, y + size,
+                    outline=color, width=2, fill=color,
+                    state=state, tags=('minion',)
+                )
+                markers_by_id[minion_id] = marker
+            else:
+                script.append(
+                    f"{canvas_path} coords {marker} "
+                    f"{x - size} {y - size} {x + size} {y + size}"
+                )
+                # Reconfiguration uniquement si la couleur ou la visibilité change
+                if marker_styles[marker] != style:
+                    script.append(
+                        f"{canvas_path} itemconfigure {marker} "
+                        f"-outline {color} -fill {color} -state {state}"
+                    )
+            
+            marker_styles[marker] = style
         
-        self._minion_markers[minion_id] = marker
+        if script:
+            self._tk_eval("\n".join(script))
+        if markers:
+            self._dirty = True
     
     def _clear_minion_markers_display(self):
-        """Efface tous les marqueurs de minions de l'affichage."""
-        if hasattr(self, '_minion_markers'):
-            for marker in self._minion_markers.values():
-                self.canvas.delete(marker)
-            self._minion_markers.clear()
+        """
+        Masque tous les marqueurs de minions et rend leurs ovals à la réserve :
+        ils sont réutilisés par les minions suivants au lieu d'être supprimés.
+        """
+        if not self._minion_markers:
+            return
+        
+        # Un seul appel Tcl pour tous les marqueurs portant le tag 'minion'
+        self._itemconfigure_tag('minion', state='hidden')
+        for marker in self._minion_markers.values():
+            self._marker_styles[marker] = (self._marker_styles[marker][0], 'hidden')
+        self._marker_pool.extend(self._minion_markers.values())
+        self._minion_markers.clear()
+        self._dirty = True
     
     def _on_window_close(self):
         """Gestionnaire de fermeture de fenêtre."""
-        print("🔴 Fermeture de l'overlay demandée")
+        log.info("🔴 Fermeture de l'overlay demandée")
         self.stop()
         if self.on_close_callback:
             self.on_close_callback()
@@ -313,55 +492,100 @@ class GameOverlay:
         Cette méthode doit être appelée dans le thread principal.
         """
         if self.is_running:
-            print("⚠️  L'overlay est déjà en cours d'exécution")
+            log.warning("⚠️  L'overlay est déjà en cours d'exécution")
             return
         
         self.is_running = True
-        self.setup_window()
-        
-        print("🚀 Overlay démarré")
-        print("   - Superposition transparente active")
-        print("   - Appuyez sur Alt+Tab pour voir les autres fenêtres")
-        print("   - Fermez cette fenêtre pour arrêter l'assistant")
+        self.ready.clear()
+        try:
+            self.setup_window()
+            
+            log.info("🚀 Overlay démarré")
+            log.info("   - Superposition transparente active")
+            log.info("   - Appuyez sur Alt+Tab pour voir les autres fenêtres")
+            log.info("   - Fermez cette fenêtre pour arrêter l'assistant")
+            
+            # Boucle d'événements Tk : les mises à jour sont traitées par _tick,
+            # replanifié avec after() (pas d'attente active)
+            self.root.after(0, self._tick)
+            self.root.mainloop()
+        finally:
+            self._destroy_window()
+            # Débloque un éventuel appelant qui attend encore le démarrage
+            self.ready.set()
+    
+    def _tick(self):
+        """
+        Traite les mises à jour en attente puis se replanifie (thread Tk).
+        Le temps passé dans le tick est déduit du délai avant le suivant.
+        """
+        t0 = time.perf_counter()
+        if not self.is_running:
+            # Arrêt demandé : sortie de mainloop, la fenêtre est détruite par run()
+            self.root.quit()
+            return
         
-        # Boucle principale de l'interface
-        self._main_loop()
-    
-    def _main_loop(self):
-        """Boucle principale de l'interface utilisateur."""
         try:
-            while self.is_running and self.root:
-                # Traitement des mises à jour
-                self._process_updates()
-                
-                # Mise à jour de l'interface
+            self._process_updates()
+            
+            # Rendu uniquement si le canvas a changé : aucun travail Tcl à vide
+            if self._dirty:
                 self.root.update_idletasks()
-                self.root.update()
-                
-                # Pause pour éviter de surcharger le CPU
-                time.sleep(config.FRAME_DELAY)
-                
+                self._dirty = False
+        except tk.TclError as e:
+            if self._window_exists():
+                # Commande rejetée mais fenêtre intacte : l'overlay continue
+                log.warning("⚠️  Erreur lors du traitement des mises à jour: %s", e)
+            else:
+                # Fenêtre Tk détruite : arrêt de la boucle
+                log.error("❌ Erreur Tk dans l'overlay: %s", e)
+                self.is_running = False
+        finally:
+            # Toute autre erreur est signalée par _report_callback_exception,
+            # la boucle des mises à jour continue tant que la fenêtre existe
+            if self.is_running and self._window_exists():
+                remaining = self._frame_budget - (time.perf_counter() - t0)
+                self.root.after(max(1, int(remaining * 1000)), self._tick)
+            else:
+                # Arrêt ou fenêtre détruite : after() échouerait, sortie de mainloop
+                self.is_running = False
+                try:
+                    self.root.quit()
+                except tk.TclError:
+                    pass
+    
+    def _window_exists(self) -> bool:
+        """Indique si la fenêtre Tk existe encore (thread Tk)."""
+        try:
+            return bool(self.root.winfo_exists())
         except tk.TclError:
-            # La fenêtre a été fermée
-            self.is_running = False
-        except Exception as e:
-            print(f"⚠️  Erreur dans la boucle principale de l'overlay: {e}")
-            self.is_running = False
+            return False
     
-    def stop(self):
-        """Arrête l'overlay et nettoie les ressources."""
-        print("⏹️  Arrêt de l'overlay...")
+    def _report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        """Signale une exception levée dans un callback Tk (remplace l'affichage par défaut)."""
+        log.warning(
+            "⚠️  Erreur lors du traitement des mises à jour: %s", exc_value,
+            exc_info=(exc_type, exc_value, exc_traceback)
+        )
+    
+    def _destroy_window(self):
+        """Détruit la fenêtre Tk (à appeler depuis le thread Tk)."""
         self.is_running = False
-        
         if self.root:
             try:
-                self.root.quit()
                 self.root.destroy()
-            except:
+            except tk.TclError:
                 pass
             self.root = None
-        
-        print("✅ Overlay arrêté")
+    
+    def stop(self):
+        """
+        Arrête l'overlay. Peut être appelé depuis n'importe quel thread :
+        la boucle Tk s'arrête au prochain _tick et détruit elle-même la fenêtre.
+        """
+        log.info("⏹️  Arrêt de l'overlay...")
+        self.is_running = False
+        log.info("✅ Overlay arrêté")
     
     def is_active(self) -> bool:
         """
@@ -384,6 +608,13 @@ class OverlayController:
         self.overlay = GameOverlay()
         self.overlay_thread = None
         self.is_running = False
+        
+        # Vrai tant que l'overlay accepte des mises à jour (seul test des producteurs)
+        self._live = False
+        
+        # Copie du mode debug de l'overlay, relue à chaque bascule : sans debug,
+        # les marqueurs sont écartés avant tout appel vers l'overlay
+        self._debug_on = False
     
     def start(self, close_callback: Optional[Callable] = None):
         """
@@ -393,7 +624,7 @@ class OverlayController:
             close_callback: Callback appelé lors de la fermeture
         """
         if self.is_running:
-            print("⚠️  L'overlay est déjà en cours d'exécution")
+            log.warning("⚠️  L'overlay est déjà en cours d'exécution")
             return
         
         if close_callback:
@@ -409,16 +640,14 @@ class OverlayController:
         self.is_running = True
         self.overlay_thread.start()
         
-        # Attendre que l'overlay soit initialisé
-        timeout = 5.0
-        start_time = time.time()
-        while not self.overlay.is_active() and (time.time() - start_time) < timeout:
-            time.sleep(0.1)
+        # Attendre que l'overlay soit initialisé (ou que son démarrage échoue)
+        self.overlay.ready.wait(timeout=5.0)
         
         if self.overlay.is_active():
-            print("✅ Overlay démarré avec succès dans un thread séparé")
+            self._live = True
+            log.info("✅ Overlay démarré avec succès dans un thread séparé")
         else:
-            print("❌ Échec du démarrage de l'overlay")
+            log.error("❌ Échec du démarrage de l'overlay")
             self.is_running = False
     
     def stop(self):
@@ -426,34 +655,40 @@ class OverlayController:
         if not self.is_running:
             return
         
+        self._live = False
         self.overlay.stop()
         self.is_running = False
         
         if self.overlay_thread and self.overlay_thread.is_alive():
             self.overlay_thread.join(timeout=2.0)
         
-        print("✅ Contrôleur d'overlay arrêté")
+        log.info("✅ Contrôleur d'overlay arrêté")
     
     def update_suggestion(self, position: Optional[Tuple[float, float]]):
         """Met à jour la suggestion de placement."""
-        if self.is_running and self.overlay.is_active():
-            self.overlay.update_suggestion(position)
+        if not self._live:
+            return
+        self.overlay.update_suggestion(position)
     
     def toggle_debug(self):
         """Active/désactive le mode debug."""
-        if self.is_running and self.overlay.is_active():
-            self.overlay.toggle_debug_mode()
+        if not self._live:
+            return
+        self.overlay.toggle_debug_mode()
+        self._debug_on = self.overlay.show_debug
     
     def add_minion_marker(self, minion_id: int, position: Tuple[float, float],
                          is_enemy: bool = False, is_predicted: bool = False):
         """Ajoute un marqueur de minion."""
-        if self.is_running and self.overlay.is_active():
-            self.overlay.add_minion_marker(minion_id, position, is_enemy, is_predicted)
+        if not self._debug_on or not self._live:
+            return
+        self.overlay.add_minion_marker(minion_id, position, is_enemy, is_predicted)
     
     def clear_minion_markers(self):
         """Efface tous les marqueurs de minions."""
-        if self.is_running and self.overlay.is_active():
-            self.overlay.clear_minion_markers()
+        if not self._live:
+            return
+        self.overlay.clear_minion_markers()
     
     def is_active(self) -> bool:
         """Vérifie si l'overlay est actif."""
@@ -508,4 +743,5 @@ def test_overlay():
 
 if __name__ == "__main__":
     # Test de l'overlay si exécuté directement
+    logging.basicConfig(level=config.LOG_LEVEL, format="%(message)s")
     test_overlay()
@@ -3,15 +3,108 @@ Module de stratégie pour l'analyseur Minion Masters.
 Gère la logique de placement optimal basée sur l'analyse des menaces ennemies.
 """
 
-import random
 import time
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
 from typing import List, Optional, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from config import (
     PLAYER_SIDE, SAFE_ZONE_THRESHOLD, PLACEMENT_PREDICTION_TIME, PLACEMENT_OFFSET_X,
     DEFENSIVE_POSITIONS_RATIOS, OFFENSIVE_POSITIONS_RATIOS, CENTRAL_POSITIONS_RATIOS
 )
-from utils import ratio_to_pixels, distance_2d
+from utils import ratio_to_pixels_np
+
+
+# ==============================================================================
+# --- NOYAUX NUMÉRIQUES ---
+# ==============================================================================
+
+def _nearest_intercept_numpy(future, candidates, player_is_left, frame_width, offset_x):
+    """Version NumPy de _nearest_intercept_kernel."""
+    avg_x, avg_y = future.mean(axis=0)
+    if player_is_left:
+        target_x = max(0.0, avg_x - offset_x)
+    else:
+        target_x = min(frame_width, avg_x + offset_x)
+    diff = candidates - np.array([target_x, avg_y], dtype=candidates.dtype)
+    return int(np.einsum('ij,ij->i', diff, diff).argmin())
+
+
+def _nearest_intercept_kernel(future, candidates, player_is_left, frame_width, offset_x):
+    """
+    Calcule le point d'interception (barycentre des positions futures décalé
+    vers l'ennemi) et renvoie l'indice de la position candidate la plus proche.
+    
+    Args:
+        future: Positions futures des ennemis (N, 2), N > 0
+        candidates: Positions stratégiques candidates (K, 2)
+        player_is_left: True si le joueur est à gauche
+        frame_width: Largeur de l'écran (borne de l'interception)
+        offset_x: Décalage horizontal de l'interception (pixels)
+    """
+    avg_x = 0.0
+    avg_y = 0.0
+    n = future.shape[0]
+    for i in range(n):
+        avg_x += future[i, 0]
+        avg_y += future[i, 1]
+    avg_x /= n
+    avg_y /= n
+    
+    if player_is_left:
+        target_x = max(0.0, avg_x - offset_x)
+    else:
+        target_x = min(frame_width, avg_x + offset_x)
+    
+    # Argmin des distances au carré (même résultat, sans racine)
+    best = 0
+    best_d2 = np.inf
+    for j in range(candidates.shape[0]):
+        dx = candidates[j, 0] - target_x
+        dy = candidates[j, 1] - avg_y
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best_d2 = d2
+            best = j
+    return best
+
+
+if njit is not None:
+    _nearest_intercept = njit(cache=True, fastmath=True)(_nearest_intercept_kernel)
+    # Compilation anticipée (évite la latence au premier placement prédictif)
+    _nearest_intercept(
+        np.zeros((1, 2)), np.zeros((1, 2), dtype=np.float32), True, 1.0, 0.0
+    )
+else:
+    _nearest_intercept = _nearest_intercept_numpy
+
+
+@dataclass(slots=True)
+class ThreatAnalysis:
+    """Résultat de l'analyse de la distribution des menaces ennemies."""
+    left_threat: int = 0
+    right_threat: int = 0
+    top_threat: int = 0
+    bottom_threat: int = 0
+    center_threat: int = 0
+    total_enemies: int = 0
+    average_position: Optional[Tuple[float, float]] = None
+    threat_clusters: list = field(default_factory=list)
+    # Dernières positions des ennemis (N, 2), réutilisables en aval
+    enemy_positions: Optional[np.ndarray] = None
+
+
+# Nombre de tirages aléatoires générés à la fois
+_RAND_BUFFER_SIZE = 1024
 
 
 class StrategyAnalyzer:
@@ -20,138 +113,192 @@ class StrategyAnalyzer:
     basé sur l'analyse des menaces ennemies et de la situation tactique.
     """
     
-    def __init__(self, frame_width: int, frame_height: int):
+    def __init__(self, frame_width: int, frame_height: int, seed: Optional[int] = None):
         """
         Initialise l'analyseur stratégique.
         
         Args:
             frame_width (int): Largeur de l'écran en pixels
             frame_height (int): Hauteur de l'écran en pixels
+            seed (int): Graine du générateur aléatoire (None = non déterministe)
         """
         self.frame_width = frame_width
         self.frame_height = frame_height
         
-        # Conversion des positions de ratios vers pixels
-        self.defensive_positions = ratio_to_pixels(
-            DEFENSIVE_POSITIONS_RATIOS, frame_width, frame_height
-        )
-        self.offensive_positions = ratio_to_pixels(
-            OFFENSIVE_POSITIONS_RATIOS, frame_width, frame_height
-        )
-        self.central_positions = ratio_to_pixels(
-            CENTRAL_POSITIONS_RATIOS, frame_width, frame_height
+        # Tirages aléatoires uniformes générés par blocs (PCG64)
+        self._rng = np.random.default_rng(seed)
+        self._rand_buf = self._rng.random(_RAND_BUFFER_SIZE).tolist()
+        self._rand_idx = 0
+        
+        # Conversion des positions de ratios vers pixels, en tableaux (N, 2)
+        defensive_np = ratio_to_pixels_np(DEFENSIVE_POSITIONS_RATIOS, frame_width, frame_height)
+        offensive_np = ratio_to_pixels_np(OFFENSIVE_POSITIONS_RATIOS, frame_width, frame_height)
+        central_np = ratio_to_pixels_np(CENTRAL_POSITIONS_RATIOS, frame_width, frame_height)
+        
+        # Listes de tuples (x, y) renvoyées comme placements
+        self.defensive_positions = [tuple(pos) for pos in defensive_np.tolist()]
+        self.offensive_positions = [tuple(pos) for pos in offensive_np.tolist()]
+        self.central_positions = [tuple(pos) for pos in central_np.tolist()]
+        
+        # Seuils des zones de menace et milieux de l'écran
+        self._left_thr = frame_width * 0.4
+        self._right_thr = frame_width * 0.6
+        self._top_thr = frame_height * 0.35
+        self._bot_thr = frame_height * 0.65
+        self._mid_x = frame_width * 0.5
+        self._mid_y = frame_height * 0.5
+        self._player_is_left = PLAYER_SIDE == "left"
+        
+        # Positions fixes : tris et extrêmes calculés une seule fois
+        by_y = itemgetter(1)
+        self._defensive_by_y_asc = sorted(self.defensive_positions, key=by_y)
+        self._defensive_by_y_desc = sorted(self.defensive_positions, key=by_y, reverse=True)
+        self._offensive_top = min(self.offensive_positions, key=by_y)
+        self._offensive_bottom = max(self.offensive_positions, key=by_y)
+        self._central_np = central_np.astype(np.float32)
+        self._all_positions = (
+            self.defensive_positions + self.offensive_positions + self.central_positions
         )
+        self._all_positions_np = np.concatenate(
+            (defensive_np, offensive_np, central_np)
+        ).astype(np.float32)
         
-        # Historique pour l'adaptation stratégique
-        self.strategy_history = []
+        # Historique pour l'adaptation stratégique : (stratégie, timestamp)
+        # des 20 derniers placements
+        self.strategy_history = deque(maxlen=20)
         self.last_placement_time = 0
         self.consecutive_same_strategy = 0
         self.current_strategy_type = None
 
-    def analyze_threat_distribution(self, enemy_minions: List) -> dict:
+    def analyze_threat_distribution(self, enemy_minions: List,
+                                    enemy_positions: Optional[np.ndarray] = None) -> ThreatAnalysis:
         """
         Analyse la distribution des menaces ennemies sur l'écran.
         
         Args:
             enemy_minions (List): Liste des minions ennemis validés
+            enemy_positions (np.ndarray): Dernières positions (N, 2) de ces minions,
+                déjà publiées par le détecteur (lues sur les minions si absentes)
             
         Returns:
-            dict: Analyse des menaces avec zones et intensités
-        """
-        threat_analysis = {
-            'left_threat': 0,
-            'right_threat': 0,
-            'top_threat': 0,
-            'bottom_threat': 0,
-            'center_threat': 0,
-            'total_enemies': len(enemy_minions),
-            'average_position': None,
-            'threat_clusters': []
-        }
-        
+            ThreatAnalysis: Analyse des menaces avec zones et intensités
+        """
         if not enemy_minions:
-            return threat_analysis
+            return ThreatAnalysis()
         
-        # Seuils pour les zones
-        left_threshold = self.frame_width * 0.4
-        right_threshold = self.frame_width * 0.6
-        top_threshold = self.frame_height * 0.35
-        bottom_threshold = self.frame_height * 0.65
+        # Comptages par zone sur toutes les positions à la fois
+        if enemy_positions is None:
+            enemy_positions = self._extract_last_positions(enemy_minions)
+        positions = enemy_positions
+        xs, ys = positions[:, 0], positions[:, 1]
         
-        total_x, total_y = 0, 0
+        # Analyse horizontale
+        left_threat = int((xs < self._left_thr).sum())
+        right_threat = int((xs > self._right_thr).sum())
         
-        for minion in enemy_minions:
-            if not minion.positions:
-                continue
-                
-            x, y = minion.positions[-1]
-            total_x += x
-            total_y += y
-            
-            # Analyse horizontale
-            if x < left_threshold:
-                threat_analysis['left_threat'] += 1
-            elif x > right_threshold:
-                threat_analysis['right_threat'] += 1
-            else:
-                threat_analysis['center_threat'] += 1
-            
+        return ThreatAnalysis(
+            left_threat=left_threat,
+            right_threat=right_threat,
             # Analyse verticale
-            if y < top_threshold:
-                threat_analysis['top_threat'] += 1
-            elif y > bottom_threshold:
-                threat_analysis['bottom_threat'] += 1
-        
-        # Position moyenne des ennemis
-        if enemy_minions:
-            threat_analysis['average_position'] = (
-                total_x / len(enemy_minions),
-                total_y / len(enemy_minions)
-            )
+            top_threat=int((ys < self._top_thr).sum()),
+            bottom_threat=int((ys > self._bot_thr).sum()),
+            center_threat=len(xs) - left_threat - right_threat,
+            total_enemies=len(enemy_minions),
+            # Position moyenne des ennemis
+            average_position=(float(xs.mean()), float(ys.mean())),
+            enemy_positions=positions
+        )
+
+    @staticmethod
+    def _extract_last_positions(enemy_minions: List) -> np.ndarray:
+        """
+        Rassemble les dernières positions connues des minions.
         
-        return threat_analysis
+        Args:
+            enemy_minions (List): Liste des minions ennemis
+            
+        Returns:
+            np.ndarray: Positions (N, 2) en float32
+        """
+        return np.asarray([minion.last_position for minion in enemy_minions], dtype=np.float32)
 
-    def calculate_optimal_placement(self, enemy_minions: List) -> Optional[Tuple[int, int]]:
+    def calculate_optimal_placement(self, enemy_minions: List,
+                                    now: Optional[float] = None,
+                                    enemy_positions: Optional[np.ndarray] = None) -> Optional[Tuple[int, int]]:
         """
         Calcule le placement optimal basé sur l'analyse des minions ennemis.
         
         Args:
             enemy_minions (List): Liste des minions ennemis validés
+            now (float): Timestamp du placement (time.time() par défaut), partagé
+                par tous les calculs du placement
+            enemy_positions (np.ndarray): Dernières positions (N, 2) des ennemis,
+                par exemple MinionDetector.enemy_last_positions
             
         Returns:
             Optional[Tuple[int, int]]: Position optimale (x, y) ou None si aucune
         """
+        if now is None:
+            now = time.time()
+        
         if not enemy_minions:
-            return self._get_default_placement()
+            return self._get_default_placement(now)
         
         # Analyse de la situation tactique
-        threat_analysis = self.analyze_threat_distribution(enemy_minions)
+        threat_analysis = self.analyze_threat_distribution(enemy_minions, enemy_positions)
         strategy_type = self._determine_strategy_type(threat_analysis)
         
         # Sélection de la position basée sur la stratégie
         position = self._select_position_by_strategy(strategy_type, threat_analysis)
         
         # Mise à jour de l'historique stratégique
-        self._update_strategy_history(strategy_type)
+        self._update_strategy_history(strategy_type, now)
         
         return position
 
-    def _determine_strategy_type(self, threat_analysis: dict) -> str:
+    def _urand(self) -> float:
+        """
+        Renvoie le prochain tirage uniforme dans [0, 1) du tampon, régénéré
+        en un seul appel lorsqu'il est épuisé.
+        
+        Returns:
+            float: Tirage aléatoire uniforme
+        """
+        if self._rand_idx >= _RAND_BUFFER_SIZE:
+            self._rand_buf = self._rng.random(_RAND_BUFFER_SIZE).tolist()
+            self._rand_idx = 0
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return value
+
+    def _choice(self, positions: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Choisit une position au hasard (équivalent de random.choice).
+        
+        Args:
+            positions (List): Positions candidates (non vide)
+            
+        Returns:
+            Tuple[int, int]: Position choisie
+        """
+        return positions[int(self._urand() * len(positions))]
+
+    def _determine_strategy_type(self, threat_analysis: ThreatAnalysis) -> str:
         """
         Détermine le type de stratégie à adopter basé sur l'analyse des menaces.
         
         Args:
-            threat_analysis (dict): Résultats de l'analyse des menaces
+            threat_analysis (ThreatAnalysis): Résultats de l'analyse des menaces
             
         Returns:
             str: Type de stratégie ('defensive', 'offensive', 'central')
         """
-        left_threat = threat_analysis['left_threat']
-        right_threat = threat_analysis['right_threat']
-        total_enemies = threat_analysis['total_enemies']
+        left_threat = threat_analysis.left_threat
+        right_threat = threat_analysis.right_threat
+        total_enemies = threat_analysis.total_enemies
         
         # Logique stratégique basée sur le côté du joueur
-        if PLAYER_SIDE == "left":
+        if self._player_is_left:
             # Joueur à gauche
             if left_threat >= SAFE_ZONE_THRESHOLD:
                 # Menace proche - stratégie défensive
@@ -177,12 +324,12 @@ class StrategyAnalyzer:
             else:
                 return self._adaptive_strategy(threat_analysis)
 
-    def _adaptive_strategy(self, threat_analysis: dict) -> str:
+    def _adaptive_strategy(self, threat_analysis: ThreatAnalysis) -> str:
         """
         Détermine une stratégie adaptative basée sur l'historique et la situation.
         
         Args:
-            threat_analysis (dict): Analyse des menaces
+            threat_analysis (ThreatAnalysis): Analyse des menaces
             
         Returns:
             str: Type de stratégie adaptée
@@ -193,11 +340,11 @@ class StrategyAnalyzer:
             return 'central'
         
         # Stratégie basée sur la position moyenne des ennemis
-        if threat_analysis['average_position']:
-            avg_x = threat_analysis['average_position'][0]
-            center_x = self.frame_width / 2
+        if threat_analysis.average_position:
+            avg_x = threat_analysis.average_position[0]
+            center_x = self._mid_x
             
-            if PLAYER_SIDE == "left":
+            if self._player_is_left:
                 if avg_x < center_x:
                     return 'defensive'  # Ennemis proches
                 else:
@@ -210,13 +357,13 @@ class StrategyAnalyzer:
         
         return 'central'  # Fallback
 
-    def _select_position_by_strategy(self, strategy_type: str, threat_analysis: dict) -> Tuple[int, int]:
+    def _select_position_by_strategy(self, strategy_type: str, threat_analysis: ThreatAnalysis) -> Tuple[int, int]:
         """
         Sélectionne une position spécifique basée sur le type de stratégie.
         
         Args:
             strategy_type (str): Type de stratégie
-            threat_analysis (dict): Analyse des menaces
+            threat_analysis (ThreatAnalysis): Analyse des menaces
             
         Returns:
             Tuple[int, int]: Position sélectionnée (x, y)
@@ -228,117 +375,103 @@ class StrategyAnalyzer:
         elif strategy_type == 'central':
             return self._select_central_position(threat_analysis)
         else:
-            return random.choice(self.central_positions)
+            return self._choice(self.central_positions)
 
-    def _select_defensive_position(self, threat_analysis: dict) -> Tuple[int, int]:
+    def _select_defensive_position(self, threat_analysis: ThreatAnalysis) -> Tuple[int, int]:
         """
         Sélectionne une position défensive optimale.
         
         Args:
-            threat_analysis (dict): Analyse des menaces
+            threat_analysis (ThreatAnalysis): Analyse des menaces
             
         Returns:
             Tuple[int, int]: Position défensive (x, y)
         """
         # Prioriser les positions défensives basées sur la menace verticale
-        if threat_analysis['top_threat'] > threat_analysis['bottom_threat']:
+        if threat_analysis.top_threat > threat_analysis.bottom_threat:
             # Plus de menaces en haut, privilégier les défenses hautes
-            defensive_positions_sorted = sorted(
-                self.defensive_positions, 
-                key=lambda pos: pos[1]
-            )
+            defensive_positions_sorted = self._defensive_by_y_asc
         else:
             # Plus de menaces en bas, privilégier les défenses basses
-            defensive_positions_sorted = sorted(
-                self.defensive_positions, 
-                key=lambda pos: pos[1], 
-                reverse=True
-            )
+            defensive_positions_sorted = self._defensive_by_y_desc
         
         # Sélection avec un peu de randomness pour éviter la prédictibilité
-        if len(defensive_positions_sorted) > 1 and random.random() > 0.7:
-            return random.choice(defensive_positions_sorted[:2])
+        if len(defensive_positions_sorted) > 1 and self._urand() > 0.7:
+            return self._choice(defensive_positions_sorted[:2])
         
         return defensive_positions_sorted[0]
 
-    def _select_offensive_position(self, threat_analysis: dict) -> Tuple[int, int]:
+    def _select_offensive_position(self, threat_analysis: ThreatAnalysis) -> Tuple[int, int]:
         """
         Sélectionne une position offensive optimale.
         
         Args:
-            threat_analysis (dict): Analyse des menaces
+            threat_analysis (ThreatAnalysis): Analyse des menaces
             
         Returns:
             Tuple[int, int]: Position offensive (x, y)
         """
         # Stratégie offensive basée sur les zones faibles
-        if threat_analysis['average_position']:
-            avg_y = threat_analysis['average_position'][1]
-            mid_y = self.frame_height / 2
+        if threat_analysis.average_position:
+            avg_y = threat_analysis.average_position[1]
+            mid_y = self._mid_y
             
             if avg_y < mid_y:
                 # Ennemis plutôt en haut, attaquer en bas
-                return min(self.offensive_positions, key=lambda pos: -pos[1])
+                return self._offensive_bottom
             else:
                 # Ennemis plutôt en bas, attaquer en haut
-                return min(self.offensive_positions, key=lambda pos: pos[1])
+                return self._offensive_top
         
-        return random.choice(self.offensive_positions)
+        return self._choice(self.offensive_positions)
 
-    def _select_central_position(self, threat_analysis: dict) -> Tuple[int, int]:
+    def _select_central_position(self, threat_analysis: ThreatAnalysis) -> Tuple[int, int]:
         """
         Sélectionne une position centrale optimale.
         
         Args:
-            threat_analysis (dict): Analyse des menaces
+            threat_analysis (ThreatAnalysis): Analyse des menaces
             
         Returns:
             Tuple[int, int]: Position centrale (x, y)
         """
         # Position centrale adaptée à la distribution des ennemis
-        if threat_analysis['average_position']:
-            avg_x, avg_y = threat_analysis['average_position']
+        if threat_analysis.average_position:
+            avg_x, avg_y = threat_analysis.average_position
             
             # Sélectionner la position centrale la plus équilibrée
-            best_position = min(
-                self.central_positions,
-                key=lambda pos: abs(pos[0] - avg_x/2) + abs(pos[1] - avg_y)
-            )
-            return best_position
+            central = self._central_np
+            scores = np.abs(central[:, 0] - avg_x * 0.5) + np.abs(central[:, 1] - avg_y)
+            return self.central_positions[int(scores.argmin())]
         
-        return random.choice(self.central_positions)
+        return self._choice(self.central_positions)
 
-    def _get_default_placement(self) -> Tuple[int, int]:
+    def _get_default_placement(self, now: float) -> Tuple[int, int]:
         """
         Retourne une position par défaut quand aucun ennemi n'est détecté.
         
+        Args:
+            now (float): Timestamp du placement
+            
         Returns:
             Tuple[int, int]: Position par défaut (x, y)
         """
         # Alterner entre positions centrales et offensives
-        if time.time() - self.last_placement_time > 5:  # 5 secondes
-            return random.choice(self.offensive_positions)
+        if now - self.last_placement_time > 5:  # 5 secondes
+            return self._choice(self.offensive_positions)
         else:
-            return random.choice(self.central_positions)
+            return self._choice(self.central_positions)
 
-    def _update_strategy_history(self, strategy_type: str):
+    def _update_strategy_history(self, strategy_type: str, current_time: float):
         """
         Met à jour l'historique stratégique pour l'analyse adaptative.
         
         Args:
             strategy_type (str): Type de stratégie utilisée
+            current_time (float): Timestamp du placement
         """
-        current_time = time.time()
-        
-        # Ajouter à l'historique
-        self.strategy_history.append({
-            'strategy': strategy_type,
-            'timestamp': current_time
-        })
-        
-        # Limiter la taille de l'historique (garder les 20 dernières)
-        if len(self.strategy_history) > 20:
-            self.strategy_history = self.strategy_history[-20:]
+        # Ajouter à l'historique (les entrées les plus anciennes sont évincées)
+        self.strategy_history.append((strategy_type, current_time))
         
         # Compter les stratégies consécutives
         if strategy_type == self.current_strategy_type:
@@ -349,13 +482,15 @@ class StrategyAnalyzer:
         
         self.last_placement_time = current_time
 
-    def get_predictive_placement(self, enemy_minions: List, prediction_time: float = None) -> Optional[Tuple[int, int]]:
+    def get_predictive_placement(self, enemy_minions: List, prediction_time: float = None,
+                                 now: Optional[float] = None) -> Optional[Tuple[int, int]]:
         """
         Calcule un placement prédictif basé sur les trajectoires ennemies.
         
         Args:
             enemy_minions (List): Liste des minions ennemis
             prediction_time (float): Temps de prédiction en secondes
+            now (float): Timestamp du placement (time.time() par défaut)
             
         Returns:
             Optional[Tuple[int, int]]: Position prédictive ou None
@@ -368,7 +503,7 @@ class StrategyAnalyzer:
         
         # Analyser les positions futures des ennemis
         future_positions = []
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         target_time = current_time + prediction_time
         
         for minion in enemy_minions:
@@ -377,29 +512,19 @@ class StrategyAnalyzer:
                 future_positions.append(pred_pos)
         
         if not future_positions:
-            return self.calculate_optimal_placement(enemy_minions)
-        
-        # Calculer une position d'interception basée sur les prédictions
-        avg_future_x = sum(pos[0] for pos in future_positions) / len(future_positions)
-        avg_future_y = sum(pos[1] for pos in future_positions) / len(future_positions)
-        
-        # Ajuster la position d'interception
-        if PLAYER_SIDE == "left":
-            intercept_x = max(0, avg_future_x - PLACEMENT_OFFSET_X)
-        else:
-            intercept_x = min(self.frame_width, avg_future_x + PLACEMENT_OFFSET_X)
-        
-        intercept_y = avg_future_y
-        
-        # Trouver la position stratégique la plus proche de l'interception
-        all_positions = self.defensive_positions + self.offensive_positions + self.central_positions
-        
-        best_position = min(
-            all_positions,
-            key=lambda pos: distance_2d(pos, (intercept_x, intercept_y))
+            return self.calculate_optimal_placement(enemy_minions, current_time)
+        
+        # Position d'interception basée sur les prédictions, puis position
+        # stratégique la plus proche (un seul noyau)
+        best_index = _nearest_intercept(
+            np.asarray(future_positions, dtype=np.float64),
+            self._all_positions_np,
+            self._player_is_left,
+            float(self.frame_width),
+            float(PLACEMENT_OFFSET_X)
         )
         
-        return best_position
+        return self._all_positions[int(best_index)]
 
     def get_strategy_stats(self) -> dict:
         """
@@ -412,10 +537,9 @@ class StrategyAnalyzer:
             return {'total_placements': 0}
         
         strategy_counts = {}
-        recent_strategies = self.strategy_history[-10:]  # 10 dernières
+        recent_strategies = islice(reversed(self.strategy_history), 10)  # 10 dernières
         
-        for entry in recent_strategies:
-            strategy = entry['strategy']
+        for strategy, _ in recent_strategies:
             strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
         
         return {
@@ -426,15 +550,17 @@ class StrategyAnalyzer:
         }
 
 
-def create_strategy_analyzer(frame_width: int, frame_height: int) -> StrategyAnalyzer:
+def create_strategy_analyzer(frame_width: int, frame_height: int,
+                             seed: Optional[int] = None) -> StrategyAnalyzer:
     """
     Factory function pour créer un analyseur stratégique.
     
     Args:
         frame_width (int): Largeur de l'écran
         frame_height (int): Hauteur de l'écran
+        seed (int): Graine du générateur aléatoire (None = non déterministe)
         
     Returns:
         StrategyAnalyzer: Instance configurée de l'analyseur
     """
-    return StrategyAnalyzer(frame_width, frame_height)
+    return StrategyAnalyzer(frame_width, frame_height, seed)
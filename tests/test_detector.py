@@ -0,0 +1,92 @@
+"""
+Tests des tableaux de suivi du détecteur (une ligne par minion suivi).
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import detector
+from minion import Minion
+
+
+class _BlankCapture:
+    """Capture d'écran remplacée par une frame noire (aucun écran dans les tests)."""
+
+    def __init__(self, monitor):
+        self._frame = np.zeros((monitor["height"], monitor["width"], 3), dtype=np.uint8)
+
+    def grab(self, dst=None):
+        return self._frame
+
+    def close(self):
+        pass
+
+
+class TrackedRowsTest(unittest.TestCase):
+    """Les tableaux parallèles restent alignés sur self.minions après croissance et compactage."""
+
+    def setUp(self):
+        with mock.patch.object(detector, "create_screen_capture", _BlankCapture):
+            self.detector = detector.MinionDetector()
+        self._hist = np.zeros(30 * 32, dtype=np.float32)
+
+    def tearDown(self):
+        self.detector.cleanup()
+
+    def _add_minion(self, timestamp):
+        det = self.detector
+        minion_id = det.next_minion_id
+        minion = Minion(minion_id, (float(minion_id), 2.0 * minion_id), None, None,
+                        det.frame_width, det.frame_height, timestamp, hist=self._hist)
+        det.minions[minion_id] = minion
+        det._add_tracked(minion)
+        det.next_minion_id += 1
+
+    def _assert_rows_aligned(self):
+        det = self.detector
+        count = len(det._tracked)
+        self.assertEqual([m.id for m in det._tracked], list(det.minions))
+        for row, minion in enumerate(det._tracked):
+            self.assertIs(det.minions[minion.id], minion)
+            np.testing.assert_array_equal(det._last_xy[row], minion.last_position)
+            self.assertEqual(det._last_seen[row], minion.last_seen)
+            self.assertEqual(det._creation_time[row], minion.creation_time)
+            self.assertEqual(det._active_mask[row], minion.active)
+        np.testing.assert_array_equal(
+            det._active_mask[:count], [m.active for m in det._tracked]
+        )
+
+    def test_growth_and_compaction(self):
+        det = self.detector
+        now = 100.0
+        # 100 minions : au-delà de la capacité initiale (64 lignes)
+        for i in range(100):
+            if 30 <= i < 50:
+                timestamp = now - 20.0  # Expirés (au-delà de REID_MAX_TIME)
+            elif i % 7 == 0:
+                timestamp = now - 6.0   # Inactifs mais conservés (au-delà de MOVEMENT_MEMORY)
+            else:
+                timestamp = now - 0.5
+            self._add_minion(timestamp)
+        self.assertGreaterEqual(len(det._last_xy), 100)
+        self._assert_rows_aligned()
+
+        det._update_minion_status(now)
+
+        self.assertEqual(len(det._tracked), 80)
+        self.assertNotIn(31, det.minions)
+        self.assertFalse(det.minions[1].active)   # i = 0 : inactif
+        self.assertTrue(det.minions[2].active)
+        self._assert_rows_aligned()
+
+        # Les lignes libérées sont réutilisées par les nouveaux minions
+        for _ in range(10):
+            self._add_minion(now)
+        self._assert_rows_aligned()
+        self.assertEqual(det._tracked[-1].id, 110)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+Tests de cohérence des noyaux numériques : version compilée (Numba si
+disponible), noyau exécuté en Python, repli NumPy et calcul de référence.
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+import detector
+import minion
+import strategy
+import utils
+
+
+class KalmanStepTest(unittest.TestCase):
+    """kalman_step, son noyau et son repli NumPy suivent le filtre de Kalman classique."""
+
+    def _reference_step(self, state, cov, zx, zy, dt, q, r):
+        F = np.eye(4)
+        F[0, 2] = F[1, 3] = dt
+        H = np.eye(4)[:2]
+        x = F @ state
+        P = F @ cov @ F.T + q * np.eye(4)
+        S = H @ P @ H.T + r * np.eye(2)
+        K = P @ H.T @ np.linalg.inv(S)
+        return x + K @ (np.array((zx, zy)) - H @ x), (np.eye(4) - K @ H) @ P
+
+    def test_paths_agree_over_a_track(self):
+        rng = np.random.default_rng(0)
+        implementations = (minion.kalman_step, minion._kalman_step_kernel,
+                           minion._kalman_step_numpy)
+        states = [np.array([100.0, 200.0, 0.0, 0.0]) for _ in implementations]
+        covs = [minion._KF_P0.copy() for _ in implementations]
+        ref_state, ref_cov = states[0].copy(), covs[0].copy()
+
+        for i in range(40):
+            dt = float(rng.uniform(0.01, 0.2))
+            zx = 100.0 + 60.0 * i * 0.05 + float(rng.normal(0.0, 2.0))
+            zy = 200.0 - 20.0 * i * 0.05 + float(rng.normal(0.0, 2.0))
+            for step, state, cov in zip(implementations, states, covs):
+                step(state, cov, zx, zy, dt, minion._KF_Q_VAR, minion._KF_R_VAR)
+            ref_state, ref_cov = self._reference_step(
+                ref_state, ref_cov, zx, zy, dt, minion._KF_Q_VAR, minion._KF_R_VAR
+            )
+
+        for state, cov in zip(states, covs):
+            np.testing.assert_allclose(state, ref_state, rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(cov, ref_cov, rtol=1e-9, atol=1e-9)
+
+
+class PredictTrajectoryTest(unittest.TestCase):
+    """predict_trajectory reproduit la cinématique à vitesse constante bornée à l'écran."""
+
+    def test_paths_agree_with_reference(self):
+        width, height, now = 1280.0, 720.0, 50.0
+        for x, y, vx, vy in ((100.0, 300.0, 80.0, -40.0), (1200.0, 20.0, 150.0, -90.0),
+                             (5.0, 700.0, -60.0, 120.0)):
+            expected = np.array([
+                (max(0.0, min(width, x + vx * dt)), max(0.0, min(height, y + vy * dt)), now + dt)
+                for dt in minion._DTS
+            ])
+            for predict in (minion.predict_trajectory, minion._predict_trajectory_kernel,
+                            minion._predict_trajectory_numpy):
+                out = np.empty((minion._PRED_STEPS, 3))
+                predict(x, y, vx, vy, minion._DTS, width, height, now, out)
+                np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-9)
+
+
+class NearestInterceptTest(unittest.TestCase):
+    """_nearest_intercept choisit la même position que la recherche d'origine."""
+
+    def _reference(self, future, candidates, player_is_left, frame_width, offset_x):
+        avg_x = sum(pos[0] for pos in future) / len(future)
+        avg_y = sum(pos[1] for pos in future) / len(future)
+        if player_is_left:
+            intercept_x = max(0, avg_x - offset_x)
+        else:
+            intercept_x = min(frame_width, avg_x + offset_x)
+        distances = [math.hypot(cx - intercept_x, cy - avg_y) for cx, cy in candidates]
+        return distances.index(min(distances))
+
+    def test_paths_agree_with_reference(self):
+        rng = np.random.default_rng(1)
+        candidates = rng.uniform((0, 0), (1280, 720), size=(25, 2)).astype(np.float32)
+        for _ in range(50):
+            future = rng.uniform((0, 0), (1280, 720), size=(int(rng.integers(1, 8)), 2))
+            for player_is_left in (True, False):
+                expected = self._reference(future.tolist(), candidates.tolist(),
+                                           player_is_left, 1280.0, 100.0)
+                for nearest in (strategy._nearest_intercept, strategy._nearest_intercept_kernel,
+                                strategy._nearest_intercept_numpy):
+                    self.assertEqual(
+                        nearest(future, candidates, player_is_left, 1280.0, 100.0), expected
+                    )
+
+
+class MeanVelocityTest(unittest.TestCase):
+    """calculate_mean_velocity moyenne les vitesses entre échantillons successifs."""
+
+    def test_paths_agree_with_reference(self):
+        rng = np.random.default_rng(2)
+        xs = np.cumsum(rng.uniform(-5, 10, size=12))
+        ys = np.cumsum(rng.uniform(-5, 10, size=12))
+        ts = np.cumsum(rng.uniform(0.02, 0.1, size=12))
+        ts[4] = ts[3]  # Intervalle nul : ignoré
+
+        velocities = [((xs[i] - xs[i - 1]) / (ts[i] - ts[i - 1]),
+                       (ys[i] - ys[i - 1]) / (ts[i] - ts[i - 1]))
+                      for i in range(1, len(ts)) if ts[i] > ts[i - 1]]
+        expected = np.mean(velocities, axis=0)
+
+        for mean_velocity in (utils._mean_velocity, utils._mean_velocity_kernel,
+                              utils._mean_velocity_numpy):
+            np.testing.assert_allclose(mean_velocity(xs, ys, ts), expected, rtol=1e-9)
+
+        positions = np.column_stack((xs, ys))
+        np.testing.assert_allclose(
+            utils.calculate_mean_velocity(positions, ts, window_size=len(ts)), expected, rtol=1e-9
+        )
+
+    def test_no_valid_interval(self):
+        xs = np.array([1.0, 2.0, 3.0])
+        ts = np.array([1.0, 1.0, 0.5])
+        for mean_velocity in (utils._mean_velocity, utils._mean_velocity_kernel,
+                              utils._mean_velocity_numpy):
+            self.assertEqual(tuple(mean_velocity(xs, xs, ts)), (0.0, 0.0))
+
+
+class ExclusionZonesTest(unittest.TestCase):
+    """Les tests d'exclusion vectorisés suivent le test point par point d'origine."""
+
+    def test_paths_agree_with_reference(self):
+        rng = np.random.default_rng(3)
+        zones = [(200.0, 360.0, 80.0), (1080.0, 360.0, 80.0), (640.0, 100.0, 40.0)]
+        zones_np = np.array(zones, dtype=np.float32)
+        points = rng.uniform((0, 0), (1280, 720), size=(300, 2))
+        expected = np.array([
+            any(math.hypot(x - cx, y - cy) <= radius for cx, cy, radius in zones)
+            for x, y in points
+        ])
+
+        for in_zones in (utils._in_exclusion_zones, utils._in_exclusion_zones_kernel,
+                         utils._in_exclusion_zones_numpy):
+            np.testing.assert_array_equal(
+                [in_zones(float(x), float(y), zones_np) for x, y in points], expected
+            )
+
+        centers = zones_np[:, :2].astype(np.float64)
+        radii_sq = zones_np[:, 2].astype(np.float64) ** 2
+        for mask in (detector.exclusion_mask, detector._exclusion_mask_kernel,
+                     detector._exclusion_mask_numpy):
+            np.testing.assert_array_equal(mask(points, centers, radii_sq), expected)
+
+
+class AssociationDistancesTest(unittest.TestCase):
+    """association_distances, son noyau et son repli NumPy donnent la même matrice."""
+
+    def test_paths_agree(self):
+        rng = np.random.default_rng(4)
+        minions = rng.uniform(0, 700, size=(6, 2)).astype(np.float32)
+        predicted = minions + rng.normal(0, 10, size=(6, 2)).astype(np.float32)
+        has_prediction = np.array([True, False, True, True, False, True])
+        detections = np.vstack((predicted[:3] + 1.0, rng.uniform(0, 700, size=(4, 2))))
+        detections = detections.astype(np.float32)
+
+        expected = _association_reference(minions, predicted, has_prediction, detections, 400.0)
+        for distances in (detector.association_distances, detector._association_distances_kernel,
+                          detector._association_distances_numpy):
+            np.testing.assert_allclose(
+                distances(minions, predicted, has_prediction, detections, 400.0),
+                expected, rtol=1e-5
+            )
+
+
+def _association_reference(minions, predicted, has_prediction, detections, tolerance_sq):
+    """Distances au carré minion × détection, divisées par 4 si la prédiction est correcte."""
+    out = np.empty((len(minions), len(detections)))
+    for i, (mx, my) in enumerate(minions.tolist()):
+        for j, (dx, dy) in enumerate(detections.tolist()):
+            distance_sq = (mx - dx) ** 2 + (my - dy) ** 2
+            px, py = predicted[i].tolist()
+            if has_prediction[i] and (px - dx) ** 2 + (py - dy) ** 2 < tolerance_sq:
+                distance_sq *= 0.25
+            out[i, j] = distance_sq
+    return out
+
+
+if __name__ == "__main__":
+    unittest.main()
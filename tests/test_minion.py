@@ -0,0 +1,39 @@
+"""
+Tests de régression du suivi des minions.
+"""
+
+import unittest
+
+import numpy as np
+
+from minion import Minion
+
+
+class SlowSteadyMinionTest(unittest.TestCase):
+    """Un minion lent mais régulier doit obtenir une direction et une classification."""
+
+    def _track(self, step_px, frames=36, fps=20.0):
+        hist = np.zeros(30 * 32, dtype=np.float32)
+        minion = Minion(1, (100.0, 300.0), None, None, 1280, 720, 0.0, hist=hist)
+        for i in range(1, frames + 1):
+            minion.update_position((100.0 + step_px * i, 300.0), None, None, i / fps, hist=hist)
+        return minion
+
+    def test_direction_and_classification(self):
+        for step_px in (5.0, 6.0, 7.0, 8.0):
+            with self.subTest(step_px=step_px):
+                minion = self._track(step_px)
+                self.assertEqual(minion.general_direction, "right")
+                self.assertIsNotNone(minion.original_classification)
+
+    def test_prediction_follows_velocity(self):
+        minion = self._track(7.0)
+        vx, _ = minion.velocity
+        self.assertGreater(vx, 1.0)
+        predicted = minion.predicted_positions
+        self.assertGreater(len(predicted), 0)
+        self.assertGreater(predicted[-1, 0], minion.last_position[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests de non-régression de l'analyse stratégique : graine et timestamps fixés,
+les placements suggérés pour un jeu d'ennemis connu sont figés.
+"""
+
+import unittest
+
+import numpy as np
+
+from minion import Minion
+from strategy import StrategyAnalyzer
+
+_WIDTH, _HEIGHT = 1920, 1080
+_HIST = np.zeros(30 * 32, dtype=np.float32)
+
+
+def _track(minion_id, start, step, updates=10, dt=0.05):
+    """Minion suivi sur une trajectoire rectiligne régulière."""
+    minion = Minion(minion_id, start, None, None, _WIDTH, _HEIGHT, 0.0, hist=_HIST)
+    for k in range(1, updates + 1):
+        position = (start[0] + step[0] * k, start[1] + step[1] * k)
+        minion.update_position(position, None, None, k * dt, hist=_HIST)
+    return minion
+
+
+class PinnedPlacementTest(unittest.TestCase):
+    """Placements figés pour StrategyAnalyzer(..., seed=0) et des timestamps explicites."""
+
+    def setUp(self):
+        self.analyzer = StrategyAnalyzer(_WIDTH, _HEIGHT, seed=0)
+        self.left_push = [_track(1, (200.0, 300.0), (8.0, 1.0)),
+                          _track(2, (300.0, 800.0), (6.0, -2.0)),
+                          _track(3, (500.0, 500.0), (7.0, 0.0))]
+        self.spread = [_track(6, (200.0, 200.0), (8.0, 0.0)),
+                       _track(7, (1000.0, 540.0), (7.0, 0.0)),
+                       _track(8, (1600.0, 850.0), (5.0, 3.0))]
+
+    def _placements(self, enemies, count=6, **kwargs):
+        return [self.analyzer.calculate_optimal_placement(enemies, now=100.0 + i, **kwargs)
+                for i in range(count)]
+
+    def test_threat_analysis(self):
+        threat = self.analyzer.analyze_threat_distribution(self.left_push)
+        self.assertEqual(
+            (threat.left_threat, threat.right_threat, threat.top_threat,
+             threat.bottom_threat, threat.center_threat, threat.total_enemies),
+            (3, 0, 1, 1, 0, 3)
+        )
+        np.testing.assert_allclose(threat.average_position, (403.3333, 530.0), rtol=1e-6)
+
+        threat = self.analyzer.analyze_threat_distribution(self.spread)
+        self.assertEqual(
+            (threat.left_threat, threat.right_threat, threat.center_threat), (1, 1, 1)
+        )
+
+    def test_defensive_placements(self):
+        self.assertEqual(
+            self._placements(self.left_push),
+            [(196, 444), (196, 444), (196, 444), (196, 444), (274, 186), (196, 444)]
+        )
+        self.assertEqual(self.analyzer.current_strategy_type, 'defensive')
+
+    def test_spread_placements(self):
+        self.assertEqual(
+            self._placements(self.spread),
+            [(384, 176), (384, 176), (384, 176), (538, 485), (384, 176), (384, 176)]
+        )
+        self.assertEqual(self.analyzer.current_strategy_type, 'offensive')
+
+    def test_published_positions_match_minions(self):
+        positions = np.array([m.last_position for m in self.left_push], dtype=np.float32)
+        self.assertEqual(
+            self._placements(self.left_push, enemy_positions=positions),
+            [(196, 444), (196, 444), (196, 444), (196, 444), (274, 186), (196, 444)]
+        )
+
+    def test_predictive_placement(self):
+        self.assertEqual(self.analyzer.get_predictive_placement(self.left_push, now=100.5),
+                         (561, 159))
+        self.assertEqual(self.analyzer.get_predictive_placement(self.spread, now=100.5),
+                         (538, 485))
+
+    def test_default_placement(self):
+        self.assertEqual(self._placements([], count=4),
+                         [(394, 300), (384, 176), (384, 176), (384, 176)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,16 @@ Fonctions utilitaires pour l'analyseur Minion Masters.
 Contient les fonctions de conversion, géométrie et manipulation d'images.
 """
 
+from math import hypot
+
 import numpy as np
 import cv2
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from config import EXCLUSION_RADIUS_RATIO, EXCLUSION_CENTER_Y_RATIO
 
 
@@ -47,6 +54,39 @@ def pixels_to_ratio(pixel_list, frame_width, frame_height):
     return [(x / frame_width, y / frame_height) for x, y in pixel_list]
 
 
+def ratio_to_pixels_np(ratios, frame_width, frame_height):
+    """
+    Version vectorisée de ratio_to_pixels pour des positions en tableau.
+    Les coordonnées sont tronquées comme dans ratio_to_pixels.
+    
+    Args:
+        ratios (np.array): Positions (N, 2) en ratios
+        frame_width (int): Largeur de l'écran en pixels
+        frame_height (int): Hauteur de l'écran en pixels
+        
+    Returns:
+        np.array: Positions (N, 2) en pixels (int32)
+    """
+    ratios = np.asarray(ratios, dtype=np.float64).reshape(-1, 2)
+    return (ratios * np.array([frame_width, frame_height], dtype=np.float64)).astype(np.int32)
+
+
+def pixels_to_ratio_np(pixels, frame_width, frame_height):
+    """
+    Version vectorisée de pixels_to_ratio pour des positions en tableau.
+    
+    Args:
+        pixels (np.array): Positions (N, 2) en pixels
+        frame_width (int): Largeur de l'écran en pixels
+        frame_height (int): Hauteur de l'écran en pixels
+        
+    Returns:
+        np.array: Positions (N, 2) en ratios (float64)
+    """
+    pixels = np.asarray(pixels, dtype=np.float64).reshape(-1, 2)
+    return pixels * np.array([1.0 / frame_width, 1.0 / frame_height])
+
+
 def distance_2d(point1, point2):
     """
     Calcule la distance euclidienne entre deux points 2D.
@@ -62,7 +102,58 @@ def distance_2d(point1, point2):
         >>> distance_2d((0, 0), (3, 4))
         5.0
     """
-    return np.hypot(point1[0] - point2[0], point1[1] - point2[1])
+    return hypot(point1[0] - point2[0], point1[1] - point2[1])
+
+
+def distance_2d_array(points1, points2):
+    """
+    Calcule les distances euclidiennes entre deux ensembles de points 2D.
+    Version vectorisée de distance_2d, pour les positions déjà en tableaux.
+    
+    Args:
+        points1 (np.array): Points (N, 2) ou point (2,)
+        points2 (np.array): Points (N, 2) ou point (2,)
+        
+    Returns:
+        np.array: Distances euclidiennes (N,)
+        
+    Example:
+        >>> distance_2d_array(np.array([[0, 0], [1, 1]]), np.array([3, 4]))
+        array([5.        , 3.60555128])
+    """
+    diff = np.asarray(points1) - np.asarray(points2)
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+
+def _in_exclusion_zones_numpy(x, y, zones):
+    """Version NumPy de _in_exclusion_zones_kernel."""
+    dx = zones[:, 0] - x
+    dy = zones[:, 1] - y
+    return bool(np.any(dx * dx + dy * dy <= zones[:, 2] * zones[:, 2]))
+
+
+def _in_exclusion_zones_kernel(x, y, zones):
+    """
+    Teste un point contre des zones d'exclusion circulaires (distances au carré).
+    
+    Args:
+        x, y: Coordonnées du point
+        zones: Tableau (K, 3) de zones (center_x, center_y, radius)
+    """
+    for i in range(zones.shape[0]):
+        dx = x - zones[i, 0]
+        dy = y - zones[i, 1]
+        if dx * dx + dy * dy <= zones[i, 2] * zones[i, 2]:
+            return True
+    return False
+
+
+if njit is not None:
+    _in_exclusion_zones = njit(cache=True, fastmath=True)(_in_exclusion_zones_kernel)
+    # Compilation anticipée (évite la latence au premier appel)
+    _in_exclusion_zones(0.0, 0.0, np.zeros((1, 3), dtype=np.float32))
+else:
+    _in_exclusion_zones = _in_exclusion_zones_numpy
 
 
 def is_in_exclusion_zone(x, y, exclusion_zones):
@@ -73,15 +164,15 @@ def is_in_exclusion_zone(x, y, exclusion_zones):
     Args:
         x (float): Coordonnée X du point
         y (float): Coordonnée Y du point
-        exclusion_zones (list): Liste de tuples (center_x, center_y, radius)
+        exclusion_zones (list | np.array): Zones (center_x, center_y, radius), de
+            préférence le tableau de create_exclusion_zones_array (aucune conversion)
         
     Returns:
         bool: True si le point est dans une zone d'exclusion
     """
-    for center_x, center_y, radius in exclusion_zones:
-        if distance_2d((x, y), (center_x, center_y)) <= radius:
-            return True
-    return False
+    if not isinstance(exclusion_zones, np.ndarray):
+        exclusion_zones = np.asarray(exclusion_zones, dtype=np.float32).reshape(-1, 3)
+    return bool(_in_exclusion_zones(float(x), float(y), exclusion_zones))
 
 
 def create_exclusion_zones(frame_width, frame_height):
@@ -105,6 +196,21 @@ def create_exclusion_zones(frame_width, frame_height):
     ]
 
 
+def create_exclusion_zones_array(frame_width, frame_height):
+    """
+    Zones d'exclusion standard sous forme de tableau, à calculer une fois et à
+    passer tel quel à is_in_exclusion_zone.
+    
+    Args:
+        frame_width (int): Largeur de l'écran en pixels
+        frame_height (int): Hauteur de l'écran en pixels
+        
+    Returns:
+        np.array: Tableau (K, 3) float32 de zones (center_x, center_y, radius)
+    """
+    return np.asarray(create_exclusion_zones(frame_width, frame_height), dtype=np.float32)
+
+
 def point_in_rect(point, rect):
     """
     Vérifie si un point se trouve dans un rectangle.
@@ -143,7 +249,7 @@ def clamp(value, min_value, max_value):
         >>> clamp(7, 0, 10)
         7
     """
-    return max(min_value, min(value, max_value))
+    return min_value if value < min_value else (max_value if value > max_value else value)
 
 
 def clamp_position(position, frame_width, frame_height):
@@ -159,12 +265,29 @@ def clamp_position(position, frame_width, frame_height):
         tuple: Position limitée (x, y)
     """
     x, y = position
+    max_x = frame_width - 1
+    max_y = frame_height - 1
     return (
-        clamp(x, 0, frame_width - 1),
-        clamp(y, 0, frame_height - 1)
+        0 if x < 0 else (max_x if x > max_x else x),
+        0 if y < 0 else (max_y if y > max_y else y)
     )
 
 
+def clamp_positions_np(positions, frame_width, frame_height):
+    """
+    Limite un tableau de positions aux dimensions de l'écran (en place).
+    
+    Args:
+        positions (np.array): Positions (N, 2), modifiées en place
+        frame_width (int): Largeur maximum
+        frame_height (int): Hauteur maximum
+        
+    Returns:
+        np.array: Le tableau positions, limité
+    """
+    return np.clip(positions, (0, 0), (frame_width - 1, frame_height - 1), out=positions)
+
+
 def get_roi_safe(image, center, size):
     """
     Extrait une région d'intérêt (ROI) de manière sécurisée.
@@ -199,6 +322,38 @@ def get_roi_safe(image, center, size):
     return roi, None, roi.size > 0
 
 
+def get_rois_safe_batch(image, centers, size):
+    """
+    Extrait les régions d'intérêt de plusieurs centres à la fois.
+    Les limites de toutes les ROI sont calculées en une passe vectorisée ;
+    seule l'extraction des vues (sans copie) reste une boucle Python.
+    
+    Args:
+        image (np.array): Image source
+        centers (np.array): Centres des ROI (N, 2) en (x, y)
+        size (int): Demi-côté des ROI (carrés de côté size*2)
+        
+    Returns:
+        list: Vue de l'image pour chaque centre, ou None si la ROI est vide
+    """
+    centers = np.asarray(centers).reshape(-1, 2)
+    if image is None or image.size == 0:
+        return [None] * len(centers)
+    
+    height, width = image.shape[:2]
+    origins = centers.astype(np.int64)
+    
+    # Limites des ROI bornées à l'image : colonnes x1, x2 et y1, y2
+    xs = np.clip(origins[:, 0, None] + (-size, size), 0, width)
+    ys = np.clip(origins[:, 1, None] + (-size, size), 0, height)
+    valid = (xs[:, 1] > xs[:, 0]) & (ys[:, 1] > ys[:, 0])
+    
+    return [
+        image[y1:y2, x1:x2] if ok else None
+        for (x1, x2), (y1, y2), ok in zip(xs.tolist(), ys.tolist(), valid.tolist())
+    ]
+
+
 def calculate_movement_vector(positions, timestamps, window_size=5):
     """
     Calcule le vecteur de mouvement moyen sur une fenêtre glissante.
@@ -211,25 +366,87 @@ def calculate_movement_vector(positions, timestamps, window_size=5):
     Returns:
         tuple: Vecteur de mouvement (dx, dy) en pixels/seconde
     """
-    if len(positions) < 2 or len(timestamps) < 2:
+    n = min(len(positions), len(timestamps))
+    if n < 2 or window_size < 2:
         return (0, 0)
     
-    # Utiliser les dernières positions dans la fenêtre
-    recent_positions = list(positions)[-window_size:]
-    recent_timestamps = list(timestamps)[-window_size:]
-    
-    if len(recent_positions) < 2:
-        return (0, 0)
-    
-    # Calculer le mouvement total sur la période
-    total_time = recent_timestamps[-1] - recent_timestamps[0]
+    # Seules les extrémités de la fenêtre comptent : accès direct, sans copie
+    first = max(0, n - window_size)
+    total_time = timestamps[n - 1] - timestamps[first]
     if total_time <= 0:
         return (0, 0)
     
-    total_dx = recent_positions[-1][0] - recent_positions[0][0]
-    total_dy = recent_positions[-1][1] - recent_positions[0][1]
+    start = positions[first]
+    end = positions[n - 1]
+    return ((end[0] - start[0]) / total_time, (end[1] - start[1]) / total_time)
+
+
+def _mean_velocity_numpy(xs, ys, ts):
+    """Version NumPy de _mean_velocity_kernel."""
+    dts = np.diff(ts)
+    valid = dts > 0
+    if not valid.any():
+        return 0.0, 0.0
+    dts = dts[valid]
+    return (
+        float(np.mean(np.diff(xs)[valid] / dts)),
+        float(np.mean(np.diff(ys)[valid] / dts))
+    )
+
+
+def _mean_velocity_kernel(xs, ys, ts):
+    """
+    Moyenne des vitesses instantanées entre échantillons successifs
+    (les intervalles de temps nuls ou négatifs sont ignorés).
+    
+    Args:
+        xs, ys: Coordonnées des positions
+        ts: Timestamps correspondants
+    """
+    sum_vx = 0.0
+    sum_vy = 0.0
+    count = 0
+    for i in range(1, ts.shape[0]):
+        dt = ts[i] - ts[i - 1]
+        if dt > 0:
+            sum_vx += (xs[i] - xs[i - 1]) / dt
+            sum_vy += (ys[i] - ys[i - 1]) / dt
+            count += 1
+    if count == 0:
+        return 0.0, 0.0
+    return sum_vx / count, sum_vy / count
+
+
+if njit is not None:
+    _mean_velocity = njit(cache=True, fastmath=True)(_mean_velocity_kernel)
+    # Compilation anticipée (évite la latence au premier appel)
+    _mean_velocity(np.zeros(2), np.zeros(2), np.arange(2.0))
+else:
+    _mean_velocity = _mean_velocity_numpy
+
+
+def calculate_mean_velocity(positions, timestamps, window_size=5):
+    """
+    Calcule la vitesse moyenne des derniers déplacements d'une fenêtre glissante,
+    en moyennant les vitesses entre échantillons successifs (plus robuste qu'un
+    simple écart entre les extrémités si un échantillon est bruité).
     
-    return (total_dx / total_time, total_dy / total_time)
+    Args:
+        positions (np.array): Historique des positions (N, 2)
+        timestamps (np.array): Historique des timestamps (N,)
+        window_size (int): Taille de la fenêtre pour le calcul
+        
+    Returns:
+        tuple: Vitesse moyenne (vx, vy) en pixels/seconde
+    """
+    points = np.asarray(positions, dtype=np.float64)[-window_size:]
+    times = np.asarray(timestamps, dtype=np.float64)[-window_size:]
+    if len(points) < 2:
+        return (0, 0)
+    vx, vy = _mean_velocity(
+        np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1]), times
+    )
+    return (float(vx), float(vy))
 
 
 def smooth_positions(positions, window_size=3):
@@ -246,22 +463,22 @@ def smooth_positions(positions, window_size=3):
     if len(positions) < window_size:
         return list(positions)
     
-    smoothed = []
     half_window = window_size // 2
+    points = np.asarray(positions, dtype=np.float64)
+    count = len(points)
     
-    for i in range(len(positions)):
-        # Déterminer les limites de la fenêtre
-        start = max(0, i - half_window)
-        end = min(len(positions), i + half_window + 1)
-        
-        # Calculer la moyenne sur la fenêtre
-        window_positions = positions[start:end]
-        avg_x = sum(pos[0] for pos in window_positions) / len(window_positions)
-        avg_y = sum(pos[1] for pos in window_positions) / len(window_positions)
-        
-        smoothed.append((avg_x, avg_y))
+    # Sommes cumulées précédées d'une ligne nulle : la somme d'une fenêtre
+    # [start, end) vaut csum[end] - csum[start]
+    csum = np.zeros((count + 1, 2))
+    np.cumsum(points, axis=0, out=csum[1:])
+    
+    # Limites des fenêtres, tronquées aux bords de la séquence
+    indices = np.arange(count)
+    starts = np.maximum(indices - half_window, 0)
+    ends = np.minimum(indices + half_window + 1, count)
     
-    return smoothed
+    smoothed = (csum[ends] - csum[starts]) / (ends - starts)[:, None]
+    return [tuple(row) for row in smoothed.tolist()]
 
 
 def calculate_speed(position1, position2, time1, time2):
@@ -297,14 +514,17 @@ def filter_detections_by_area(contours, min_area, max_area):
     Returns:
         list: Positions des centres des contours valides (x, y)
     """
-    valid_positions = []
+    areas = np.fromiter(
+        (cv2.contourArea(contour) for contour in contours),
+        dtype=np.float64, count=len(contours)
+    )
+    keep = np.flatnonzero((areas > min_area) & (areas < max_area))
     
-    for contour in contours:
-        area = cv2.contourArea(contour)
-        if min_area < area < max_area:
-            # Calculer le centre du contour
-            (x, y), _ = cv2.minEnclosingCircle(contour)
-            valid_positions.append((x, y))
+    valid_positions = []
+    for i in keep:
+        # Centre du contour : barycentre par les moments (aire non nulle garantie)
+        moments = cv2.moments(contours[i])
+        valid_positions.append((moments['m10'] / moments['m00'], moments['m01'] / moments['m00']))
     
     return valid_positions
 
@@ -321,12 +541,13 @@ def create_circular_mask(image_shape, center, radius):
     Returns:
         np.array: Masque binaire (255 à l'intérieur du cercle, 0 à l'extérieur)
     """
-    height, width = image_shape[:2]
-    y, x = np.ogrid[:height, :width]
-    center_x, center_y = center
-    
-    mask = ((x - center_x) ** 2 + (y - center_y) ** 2) <= radius ** 2
-    return mask.astype(np.uint8) * 255
+    # Remplissage du disque seul par rasterisation OpenCV (pas de calcul sur toute l'image)
+    mask = np.zeros(image_shape[:2], dtype=np.uint8)
+    cv2.circle(
+        mask, (int(round(center[0])), int(round(center[1]))), int(round(radius)),
+        255, thickness=-1, lineType=cv2.LINE_8
+    )
+    return mask
 
 
 def get_screen_quadrant(position, frame_width, frame_height):
@@ -363,7 +584,7 @@ def interpolate_position(pos1, pos2, ratio):
     Returns:
         tuple: Position interpolée (x, y)
     """
-    ratio = clamp(ratio, 0.0, 1.0)
+    ratio = 0.0 if ratio < 0.0 else (1.0 if ratio > 1.0 else ratio)
     x = pos1[0] + (pos2[0] - pos1[0]) * ratio
     y = pos1[1] + (pos2[1] - pos1[1]) * ratio
     return (x, y)
@@ -386,14 +607,13 @@ def format_time_duration(seconds):
     if seconds < 60:
         return f"{seconds:.1f}s"
     
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
+    minutes, remaining_seconds = divmod(seconds, 60)
+    minutes = int(minutes)
     
     if minutes < 60:
         return f"{minutes}m {remaining_seconds:.1f}s"
     
-    hours = int(minutes // 60)
-    remaining_minutes = minutes % 60
+    hours, remaining_minutes = divmod(minutes, 60)
     return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
 
 
@@ -409,7 +629,7 @@ def debug_print_minion_info(minion):
         print("❌ Minion None")
         return
     
-    current_pos = minion.positions[-1] if minion.positions else "Unknown"
+    current_pos = minion.last_position
     
     print(f"🔍 Minion #{minion.id}")
     print(f"   Position: {current_pos}")